@@ -129,6 +129,11 @@ class Settings(BaseSettings):
     WORKING_HOURS_START: int = 9
     WORKING_HOURS_END: int = 18
     
+    # ML Inference
+    PREDICT_CONCURRENCY: int = 8  # Max in-flight predictions per batch request
+    INFERENCE_PROCESS_WORKER: bool = False  # Score batches in a dedicated worker process
+    PIPELINE_PROCESS_WORKERS: int = 0  # >0 runs preprocessing/feature extraction in worker processes
+    
     # Privacy
     ANONYMIZE_DATA: bool = True
     HASH_ALGORITHM: str = "sha256"
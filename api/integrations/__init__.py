@@ -1 +1,4 @@
 # Integrations package
+
+# Indexed directly by datetime.weekday() (0=Monday)
+WEEKDAY_NAMES = ("Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday")
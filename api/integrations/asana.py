@@ -9,6 +9,8 @@ from typing import Dict, List, Optional
 from urllib.parse import urlencode
 import logging
 
+from integrations import WEEKDAY_NAMES
+
 logger = logging.getLogger(__name__)
 
 
@@ -277,7 +279,7 @@ class AsanaAPI:
             avg_tasks_per_day = total_tasks / days_range if days_range > 0 else 0
             
             # Calculate tasks by day of week
-            tasks_by_weekday = {i: 0 for i in range(7)}  # 0=Monday, 6=Sunday
+            tasks_by_weekday = [0] * 7  # 0=Monday, 6=Sunday
             for task in filtered_tasks:
                 modified_at = datetime.fromisoformat(task["modified_at"].replace("Z", "+00:00"))
                 tasks_by_weekday[modified_at.weekday()] += 1
@@ -294,10 +296,7 @@ class AsanaAPI:
                 "avg_subtasks_per_task": avg_subtasks,
                 "avg_tasks_per_day": avg_tasks_per_day,
                 "status_distribution": status_distribution,
-                "tasks_by_weekday": {
-                    ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"][day]: count
-                    for day, count in tasks_by_weekday.items()
-                },
+                "tasks_by_weekday": dict(zip(WEEKDAY_NAMES, tasks_by_weekday)),
                 "overdue_ratio": len(overdue_tasks) / len(incomplete_tasks) if incomplete_tasks else 0
             }
         
@@ -9,6 +9,7 @@ import logging
 from urllib.parse import urlencode
 
 from config import settings
+from integrations import WEEKDAY_NAMES
 
 logger = logging.getLogger(__name__)
 
@@ -494,8 +495,8 @@ class GitHubAPI:
             unique_repos = len(all_repos)
             
             # Activity distribution by day of week
-            commit_by_weekday = {i: 0 for i in range(7)}
-            pr_by_weekday = {i: 0 for i in range(7)}
+            commit_by_weekday = [0] * 7
+            pr_by_weekday = [0] * 7
             
             for commit in commits:
                 if commit.get("date"):
@@ -541,14 +542,8 @@ class GitHubAPI:
                 "repo_context_switching": unique_repos,  # Higher = more context switching
                 "active_days": active_days,
                 "activity_consistency": activity_consistency,
-                "commit_by_weekday": {
-                    ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"][day]: count
-                    for day, count in commit_by_weekday.items()
-                },
-                "pr_by_weekday": {
-                    ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"][day]: count
-                    for day, count in pr_by_weekday.items()
-                }
+                "commit_by_weekday": dict(zip(WEEKDAY_NAMES, commit_by_weekday)),
+                "pr_by_weekday": dict(zip(WEEKDAY_NAMES, pr_by_weekday))
             }
         
         except Exception as e:
@@ -720,9 +720,10 @@ class GoogleSheetsAPI:
             
             if week_start:
                 try:
-                    summary_week_start = datetime.strptime(
-                        summary.get("Week Start Date", ""),
-                        "%Y-%m-%d"
+                    # Column is written with strftime("%Y-%m-%d"); fromisoformat
+                    # parses that in C without strptime's format interpreter
+                    summary_week_start = datetime.fromisoformat(
+                        summary.get("Week Start Date", "")
                     )
                     if summary_week_start != week_start:
                         continue
@@ -3,14 +3,52 @@ Jira OAuth2 and API integration for workforce wellbeing analysis
 Supports Jira Cloud with OAuth 2.0 (3LO)
 """
 
+import asyncio
 import httpx
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional
 from urllib.parse import urlencode
 import logging
 
+from integrations import WEEKDAY_NAMES
+
 logger = logging.getLogger(__name__)
 
+# Jira Cloud returns at most this many issues per search page
+SEARCH_PAGE_SIZE = 100
+
+# Cap on search pages fetched concurrently for a single user
+MAX_CONCURRENT_PAGES = 5
+
+# Shared client so concurrent requests reuse pooled keep-alive connections
+_http_client: Optional[httpx.AsyncClient] = None
+
+
+def _get_http_client() -> httpx.AsyncClient:
+    """Get or create the shared Jira API HTTP client"""
+    global _http_client
+    
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.AsyncClient(
+            timeout=30.0,
+            limits=httpx.Limits(
+                max_connections=100,
+                max_keepalive_connections=20,
+                keepalive_expiry=60.0
+            )
+        )
+    
+    return _http_client
+
+
+async def close_http_client():
+    """Close the shared Jira API HTTP client, if it was created"""
+    global _http_client
+    
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+
 
 class JiraOAuth:
     """Handle Jira OAuth 2.0 (3LO) authentication"""
@@ -45,61 +83,61 @@ class JiraOAuth:
     
     async def exchange_code_for_token(self, code: str) -> Dict:
         """Exchange authorization code for access token"""
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                self.token_url,
-                json={
-                    "grant_type": "authorization_code",
-                    "client_id": self.client_id,
-                    "client_secret": self.client_secret,
-                    "code": code,
-                    "redirect_uri": self.redirect_uri
-                },
-                headers={"Content-Type": "application/json"}
-            )
-            
-            if response.status_code != 200:
-                logger.error(f"Token exchange failed: {response.text}")
-                raise Exception(f"Failed to exchange code for token: {response.text}")
-            
-            return response.json()
+        client = _get_http_client()
+        response = await client.post(
+            self.token_url,
+            json={
+                "grant_type": "authorization_code",
+                "client_id": self.client_id,
+                "client_secret": self.client_secret,
+                "code": code,
+                "redirect_uri": self.redirect_uri
+            },
+            headers={"Content-Type": "application/json"}
+        )
+        
+        if response.status_code != 200:
+            logger.error(f"Token exchange failed: {response.text}")
+            raise Exception(f"Failed to exchange code for token: {response.text}")
+        
+        return response.json()
     
     async def refresh_access_token(self, refresh_token: str) -> Dict:
         """Refresh the access token using refresh token"""
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                self.token_url,
-                json={
-                    "grant_type": "refresh_token",
-                    "client_id": self.client_id,
-                    "client_secret": self.client_secret,
-                    "refresh_token": refresh_token
-                },
-                headers={"Content-Type": "application/json"}
-            )
-            
-            if response.status_code != 200:
-                logger.error(f"Token refresh failed: {response.text}")
-                raise Exception(f"Failed to refresh token: {response.text}")
-            
-            return response.json()
+        client = _get_http_client()
+        response = await client.post(
+            self.token_url,
+            json={
+                "grant_type": "refresh_token",
+                "client_id": self.client_id,
+                "client_secret": self.client_secret,
+                "refresh_token": refresh_token
+            },
+            headers={"Content-Type": "application/json"}
+        )
+        
+        if response.status_code != 200:
+            logger.error(f"Token refresh failed: {response.text}")
+            raise Exception(f"Failed to refresh token: {response.text}")
+        
+        return response.json()
     
     async def get_accessible_resources(self, access_token: str) -> List[Dict]:
         """Get list of Jira sites the user has access to"""
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                self.resource_url,
-                headers={
-                    "Authorization": f"Bearer {access_token}",
-                    "Accept": "application/json"
-                }
-            )
-            
-            if response.status_code != 200:
-                logger.error(f"Failed to get resources: {response.text}")
-                raise Exception(f"Failed to get accessible resources: {response.text}")
-            
-            return response.json()
+        client = _get_http_client()
+        response = await client.get(
+            self.resource_url,
+            headers={
+                "Authorization": f"Bearer {access_token}",
+                "Accept": "application/json"
+            }
+        )
+        
+        if response.status_code != 200:
+            logger.error(f"Failed to get resources: {response.text}")
+            raise Exception(f"Failed to get accessible resources: {response.text}")
+        
+        return response.json()
 
 
 class JiraAPI:
@@ -116,15 +154,15 @@ class JiraAPI:
     
     async def _make_request(self, endpoint: str, params: Optional[Dict] = None) -> Dict:
         """Make authenticated request to Jira API"""
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            url = f"{self.base_url}/{endpoint}"
-            response = await client.get(url, headers=self.headers, params=params)
-            
-            if response.status_code != 200:
-                logger.error(f"Jira API request failed: {response.status_code} - {response.text}")
-                raise Exception(f"Jira API error: {response.status_code}")
-            
-            return response.json()
+        client = _get_http_client()
+        url = f"{self.base_url}/{endpoint}"
+        response = await client.get(url, headers=self.headers, params=params)
+        
+        if response.status_code != 200:
+            logger.error(f"Jira API request failed: {response.status_code} - {response.text}")
+            raise Exception(f"Jira API error: {response.status_code}")
+        
+        return response.json()
     
     async def get_current_user(self) -> Dict:
         """Get current authenticated user information"""
@@ -164,14 +202,37 @@ class JiraAPI:
             
             params = {
                 "jql": jql,
-                "maxResults": max_results,
+                "startAt": 0,
+                "maxResults": min(max_results, SEARCH_PAGE_SIZE),
                 "fields": "summary,status,priority,created,updated,assignee,creator,resolutiondate,issuetype,timetracking,worklog,project"
             }
             
+            # First page tells us the total; fetch the remaining pages concurrently
             data = await self._make_request("search", params)
+            raw_issues = list(data.get("issues", []))
+            page_size = len(raw_issues)
+            total = min(data.get("total", page_size), max_results)
+            
+            if page_size and total > page_size:
+                semaphore = asyncio.Semaphore(MAX_CONCURRENT_PAGES)
+                
+                async def fetch_page(start_at: int) -> Dict:
+                    async with semaphore:
+                        return await self._make_request("search", {
+                            **params,
+                            "startAt": start_at,
+                            "maxResults": min(page_size, total - start_at)
+                        })
+                
+                pages = await asyncio.gather(*(
+                    fetch_page(start_at)
+                    for start_at in range(page_size, total, page_size)
+                ))
+                for page in pages:
+                    raw_issues.extend(page.get("issues", []))
             
             issues = []
-            for issue in data.get("issues", []):
+            for issue in raw_issues:
                 fields = issue.get("fields", {})
                 issues.append({
                     "key": issue.get("key"),
@@ -285,7 +346,7 @@ class JiraAPI:
             total_time_estimated = sum(i["time_estimate"] for i in assigned_issues if i["time_estimate"])
             
             # Worklog distribution by day of week
-            worklog_by_day = {i: 0 for i in range(7)}  # 0=Monday, 6=Sunday
+            worklog_by_day = [0] * 7  # 0=Monday, 6=Sunday
             for worklog in worklogs:
                 started = datetime.fromisoformat(worklog["started"].replace("Z", "+00:00"))
                 worklog_by_day[started.weekday()] += worklog["time_spent_seconds"]
@@ -307,8 +368,8 @@ class JiraAPI:
                 "avg_time_per_day_seconds": total_time_spent / days_range if days_range > 0 else 0,
                 "avg_time_per_day_hours": (total_time_spent / 3600) / days_range if days_range > 0 else 0,
                 "worklog_by_weekday": {
-                    ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"][day]: seconds / 3600
-                    for day, seconds in worklog_by_day.items()
+                    name: seconds / 3600
+                    for name, seconds in zip(WEEKDAY_NAMES, worklog_by_day)
                 },
                 "unique_projects": len(set(i["project"] for i in assigned_issues if i["project"])),
                 "context_switching_score": len(set(i["project"] for i in assigned_issues if i["project"])),  # Higher = more context switching
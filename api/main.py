@@ -2,6 +2,15 @@
 Workforce Wellbeing Analytics - API Backend
 OAuth2-based integration with workplace tools
 """
+import os
+
+# Cap BLAS/OpenMP pools at one thread per call before numpy, sklearn or
+# xgboost load: concurrent requests already use the cores, and nested
+# pools oversubscribe them. Favours throughput over single-request
+# latency; export the variables to override.
+for _var in ("OMP_NUM_THREADS", "MKL_NUM_THREADS", "OPENBLAS_NUM_THREADS"):
+    os.environ.setdefault(_var, "1")
+
 from fastapi import FastAPI, Depends, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import RedirectResponse
@@ -11,6 +20,10 @@ import logging
 from routers import auth, data, users, features, dashboard, attendance, pipeline
 from database import engine, Base
 from config import settings
+from services.parallel_inference import get_inference_service
+from services.stream_pipeline import shutdown_stream_pipeline
+from utils.json_route import ORJSONResponse
+from integrations.jira import close_http_client as close_jira_http_client
 
 # Configure logging
 logging.basicConfig(
@@ -34,10 +47,20 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         logger.error(f"⚠️  Database initialization warning: {e}")
     
+    # Load ML models before the first request instead of on it
+    try:
+        logger.info("🔧 Loading ML models...")
+        get_inference_service()
+        logger.info("✅ ML models loaded")
+    except Exception as e:
+        logger.error(f"⚠️  ML model preload warning: {e}")
+    
     yield
     
     # Shutdown
     logger.info("👋 Shutting down API")
+    shutdown_stream_pipeline()
+    await close_jira_http_client()
 
 
 # Initialize FastAPI app
@@ -45,7 +68,8 @@ app = FastAPI(
     title="Workforce Wellbeing Analytics API",
     description="OAuth2-based integration platform for workplace productivity and wellbeing analysis",
     version="1.0.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
 
 # CORS middleware
@@ -21,9 +21,11 @@ logger = logging.getLogger(__name__)
 router = APIRouter()
 
 
-async def get_valid_token(user_id: str, provider: str, db: Session) -> str:
+def get_valid_token_record(user_id: str, provider: str, db: Session) -> OAuthToken:
     """
-    Get a valid access token, refreshing if necessary
+    Get the user's token record for a provider, rejecting missing or expired tokens
+    
+    Blocking (runs a DB query); async callers should run it in an executor.
     """
     token_record = db.query(OAuthToken).filter(
         OAuthToken.user_id == user_id,
@@ -39,6 +41,15 @@ async def get_valid_token(user_id: str, provider: str, db: Session) -> str:
         # This would trigger the refresh flow
         raise HTTPException(status_code=401, detail="Token expired, please refresh")
     
+    return token_record
+
+
+async def get_valid_token(user_id: str, provider: str, db: Session) -> str:
+    """
+    Get a valid access token, refreshing if necessary
+    """
+    token_record = get_valid_token_record(user_id, provider, db)
+    
     # Decrypt and return token
     return decrypt_token(token_record.access_token)
 
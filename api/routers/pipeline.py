@@ -6,19 +6,23 @@ from fastapi import APIRouter, HTTPException, Depends
 from sqlalchemy.orm import Session
 from datetime import datetime, timedelta
 from typing import Optional, List, Dict, Any
+import asyncio
 import logging
+import time
 
 from database import get_db
 from services.stream_pipeline import get_stream_pipeline
 from services.parallel_inference import get_inference_service
-from routers.data import get_valid_token
+from routers.data import get_valid_token, get_valid_token_record
+from utils.encryption import decrypt_token
+from utils.json_route import ORJSONResponse, ORJSONRoute
 from integrations.microsoft_graph import MicrosoftGraphAPI
 from integrations.slack import SlackAPI
 from integrations.jira import JiraAPI
 
 logger = logging.getLogger(__name__)
 
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse, route_class=ORJSONRoute)
 
 
 @router.get("/")
@@ -31,7 +35,8 @@ async def pipeline_info():
         "endpoints": {
             "process_stream": "POST /pipeline/process",
             "process_and_predict": "POST /pipeline/predict",
-            "health": "GET /pipeline/health"
+            "health": "GET /pipeline/health",
+            "metrics": "GET /pipeline/metrics"
         },
         "capabilities": [
             "Real-time data validation and cleaning",
@@ -71,6 +76,17 @@ async def pipeline_health():
     }
 
 
+@router.get("/metrics")
+async def pipeline_metrics():
+    """Report inference cache statistics"""
+    inference = get_inference_service()
+    
+    return {
+        "prediction_cache": inference.cache_info(),
+        "timestamp": datetime.utcnow().isoformat()
+    }
+
+
 @router.post("/process")
 async def process_stream(
     raw_data: Dict[str, List[Dict]],
@@ -129,7 +145,7 @@ async def process_and_predict(
     """
     try:
         logger.info(f"🚀 Starting full pipeline for user {user_id}")
-        pipeline_start = datetime.utcnow()
+        pipeline_start_ns = time.monotonic_ns()
         
         # Step 1: Fetch or use custom data
         if custom_data:
@@ -171,16 +187,15 @@ async def process_and_predict(
                 detail="Model inference failed"
             )
         
-        pipeline_end = datetime.utcnow()
-        total_time = (pipeline_end - pipeline_start).total_seconds()
+        total_time_ms = (time.monotonic_ns() - pipeline_start_ns) / 1e6
         
-        logger.info(f"✅ Full pipeline complete in {total_time:.2f}s")
+        logger.info(f"✅ Full pipeline complete in {total_time_ms / 1000:.2f}s")
         
         # Combine results
         return {
             "status": "success",
             "user_id": user_id,
-            "timestamp": pipeline_end.isoformat(),
+            "timestamp": datetime.utcnow().isoformat(),
             "data_source": data_source,
             "pipeline_results": {
                 "validation_report": processed_result["validation_report"],
@@ -191,9 +206,9 @@ async def process_and_predict(
             "priority_actions": predictions["priority_actions"],
             "feature_info": predictions["feature_info"],
             "performance": {
-                "total_pipeline_time_ms": total_time * 1000,
+                "total_pipeline_time_ms": total_time_ms,
                 "preprocessing_time_ms": (
-                    total_time * 1000 - 
+                    total_time_ms -
                     predictions["performance"]["total_inference_time_ms"]
                 ),
                 "inference_time_ms": predictions["performance"]["total_inference_time_ms"],
@@ -258,8 +273,8 @@ async def _fetch_data_from_apis(
     Returns:
         Dictionary with raw data from all sources
     """
-    start_date = datetime.utcnow() - timedelta(days=days_back)
     end_date = datetime.utcnow()
+    start_date = end_date - timedelta(days=days_back)
     
     raw_data = {
         "calendar_events": [],
@@ -310,17 +325,12 @@ async def _fetch_data_from_apis(
     # Fetch from Jira
     if "jira" in providers:
         try:
-            from database import OAuthToken
-            
-            access_token = await get_valid_token(user_id, "jira", db)
-            
-            # Get cloud_id from token metadata
-            token_record = db.query(OAuthToken).filter(
-                OAuthToken.user_id == user_id,
-                OAuthToken.provider == "jira"
-            ).first()
-            
-            cloud_id = token_record.metadata.get("cloud_id") if token_record else None
+            # One query for both the token and its cloud_id, off the event loop
+            token_record = await asyncio.get_running_loop().run_in_executor(
+                None, get_valid_token_record, user_id, "jira", db
+            )
+            access_token = decrypt_token(token_record.access_token)
+            cloud_id = (token_record.extra_metadata or {}).get("cloud_id")
             
             if cloud_id:
                 jira_api = JiraAPI(access_token, cloud_id)
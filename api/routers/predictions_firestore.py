@@ -3,29 +3,42 @@ Prediction Router - ML Model Inference Endpoints
 Connects the trained ML models with employee data from Firebase
 """
 from fastapi import APIRouter, HTTPException, Depends
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from typing import Dict, List, Optional
-import sys
-from pathlib import Path
+import asyncio
 import logging
 
-# Add model directory to path
-model_path = Path(__file__).parent.parent.parent / "model" / "models" / "inference"
-sys.path.insert(0, str(model_path))
+from config import settings
 
-from predict import WorkforceAnalyticsPredictor
+from services.model_loader import get_predictor
+from services.parallel_inference import BatchingInferenceService
+from utils.json_route import ORJSONResponse, ORJSONRoute
 
 logger = logging.getLogger(__name__)
 
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse, route_class=ORJSONRoute)
 
-# Initialize predictor (global instance)
+# EmployeeFeatures is written for the default model set, so /predict keeps
+# that predictor; the batcher coalesces concurrent requests into one model call
 try:
-    predictor = WorkforceAnalyticsPredictor()
+    predictor = get_predictor()
+    _batcher = BatchingInferenceService(predictor)
+    _feature_columns = frozenset(predictor.feature_columns)
     logger.info("✅ ML Predictor initialized successfully")
 except Exception as e:
     logger.error(f"❌ Failed to initialize predictor: {e}")
     predictor = None
+    _batcher = None
+    _feature_columns = frozenset()
+
+# Below this many provided features the models only see imputed defaults,
+# so the baseline prediction is returned without running inference
+MIN_FEATURES_FOR_PREDICTION = 3
+
+_INSUFFICIENT_DATA_RECOMMENDATIONS = (
+    f"ℹ️ Insufficient data - provide at least {MIN_FEATURES_FOR_PREDICTION} features for a personalized prediction",
+    "Connect integrations to collect work pattern data",
+)
 
 
 class EmployeeFeatures(BaseModel):
@@ -81,9 +94,10 @@ class EmployeeFeatures(BaseModel):
     role_Developer: Optional[int] = 0
     role_Designer: Optional[int] = 0
     role_Manager: Optional[int] = 0
-    role_QA_Engineer: Optional[int] = 0
-    role_Senior_Developer: Optional[int] = 0
-    role_Tech_Lead: Optional[int] = 0
+    # Model columns for multi-word roles contain spaces
+    role_QA_Engineer: Optional[int] = Field(0, serialization_alias='role_QA Engineer')
+    role_Senior_Developer: Optional[int] = Field(0, serialization_alias='role_Senior Developer')
+    role_Tech_Lead: Optional[int] = Field(0, serialization_alias='role_Tech Lead')
     
     # Additional fields can be added as needed
     focus_time_hours: Optional[float] = None
@@ -92,8 +106,8 @@ class EmployeeFeatures(BaseModel):
     bugs_reported: Optional[int] = None
     bugs_fixed: Optional[int] = None
     
-    class Config:
-        schema_extra = {
+    model_config = {
+        "json_schema_extra": {
             "example": {
                 "age": 32,
                 "experience_years": 5,
@@ -105,6 +119,7 @@ class EmployeeFeatures(BaseModel):
                 "role_Developer": 1
             }
         }
+    }
 
 
 class PredictionRequest(BaseModel):
@@ -131,6 +146,72 @@ class PredictionResponse(BaseModel):
     recommendations: List[str]
 
 
+def _count_provided_features(features_dict: Dict) -> int:
+    """
+    Count provided model features; keys the model does not use are ignored,
+    and the role flags count once, only when one is actually set
+    """
+    provided = sum(
+        1 for k in features_dict
+        if k in _feature_columns and not k.startswith('role_')
+    )
+    if any(v == 1 for k, v in features_dict.items() if k in _feature_columns and k.startswith('role_')):
+        provided += 1
+    return provided
+
+
+# Model output for an employee with every feature imputed, filled on first use
+_baseline: Optional[Dict] = None
+
+
+async def _baseline_predictions() -> Dict:
+    """Baseline predictions, scored once through the batcher like any request"""
+    global _baseline
+    
+    if _baseline is None:
+        _baseline, _ = await _batcher.predict({'role_Developer': 1})
+    
+    return _baseline
+
+
+def _build_prediction_response(
+    employee_id: str,
+    features_dict: Dict,
+    predictions: Dict
+) -> PredictionResponse:
+    """Assemble the prediction response (runs in a worker thread)"""
+    # Get categories
+    risk_cat, risk_desc = predictor.get_risk_category(predictions['burnout_risk'])
+    wellbeing_cat, wellbeing_desc = predictor.get_wellbeing_category(predictions['wellbeing'])
+    efficiency_cat, efficiency_desc = predictor.get_efficiency_category(predictions['efficiency'])
+    
+    # Get imputation info
+    imputation_info = predictor.get_imputed_summary(features_dict)
+    
+    # Generate recommendations
+    recommendations = _generate_recommendations(
+        predictions['burnout_risk'],
+        predictions['wellbeing'],
+        predictions['efficiency']
+    )
+    
+    return PredictionResponse(
+        employee_id=employee_id,
+        burnout_risk=float(predictions['burnout_risk']),
+        burnout_percentage=float(predictions['burnout_risk'] * 100),
+        wellbeing_score=float(predictions['wellbeing']),
+        efficiency_score=float(predictions['efficiency']),
+        risk_category=risk_cat,
+        risk_description=risk_desc,
+        wellbeing_category=wellbeing_cat,
+        efficiency_category=efficiency_cat,
+        data_completeness=imputation_info['data_completeness'],
+        provided_features=imputation_info['provided_features'],
+        imputed_features=imputation_info['imputed_features'],
+        recommendations=recommendations
+    )
+
+
 @router.post("/predict", response_model=PredictionResponse)
 async def predict_employee_metrics(request: PredictionRequest):
     """
@@ -149,10 +230,7 @@ async def predict_employee_metrics(request: PredictionRequest):
     try:
         # Convert Pydantic model to dict, filtering out None values
         if request.features:
-            features_dict = {
-                k: v for k, v in request.features.dict().items() 
-                if v is not None
-            }
+            features_dict = request.features.model_dump(exclude_none=True, by_alias=True)
         else:
             # TODO: Fetch from integrations if fetch_from_integrations=True
             raise HTTPException(
@@ -160,38 +238,31 @@ async def predict_employee_metrics(request: PredictionRequest):
                 detail="Features must be provided. Integration fetching not yet implemented."
             )
         
-        # Get predictions
-        predictions = predictor.predict_all(features_dict)
-        
-        # Get categories
-        risk_cat, risk_desc = predictor.get_risk_category(predictions['burnout_risk'])
-        wellbeing_cat, wellbeing_desc = predictor.get_wellbeing_category(predictions['wellbeing'])
-        efficiency_cat, efficiency_desc = predictor.get_efficiency_category(predictions['efficiency'])
-        
-        # Get imputation info
-        imputation_info = predictor.get_imputed_summary(features_dict)
+        # Skip inference when there is too little real data to personalize
+        provided = _count_provided_features(features_dict)
+        if provided < MIN_FEATURES_FOR_PREDICTION:
+            response = await asyncio.to_thread(
+                _build_prediction_response,
+                request.employee_id,
+                features_dict,
+                await _baseline_predictions()
+            )
+            response.data_completeness = "insufficient"
+            response.provided_features = provided
+            response.imputed_features = len(_feature_columns) - provided
+            response.recommendations = list(_INSUFFICIENT_DATA_RECOMMENDATIONS)
+            return response
         
-        # Generate recommendations
-        recommendations = _generate_recommendations(
-            predictions['burnout_risk'],
-            predictions['wellbeing'],
-            predictions['efficiency']
-        )
+        # Get predictions
+        predictions, _ = await _batcher.predict(features_dict)
         
-        return PredictionResponse(
-            employee_id=request.employee_id,
-            burnout_risk=float(predictions['burnout_risk']),
-            burnout_percentage=float(predictions['burnout_risk'] * 100),
-            wellbeing_score=float(predictions['wellbeing']),
-            efficiency_score=float(predictions['efficiency']),
-            risk_category=risk_cat,
-            risk_description=risk_desc,
-            wellbeing_category=wellbeing_cat,
-            efficiency_category=efficiency_cat,
-            data_completeness=imputation_info['data_completeness'],
-            provided_features=imputation_info['provided_features'],
-            imputed_features=imputation_info['imputed_features'],
-            recommendations=recommendations
+        # Categories, imputation summary and recommendations are CPU-bound,
+        # so build the response off the event loop
+        return await asyncio.to_thread(
+            _build_prediction_response,
+            request.employee_id,
+            features_dict,
+            predictions
         )
         
     except Exception as e:
@@ -210,17 +281,27 @@ async def predict_batch(employees: List[PredictionRequest]):
             detail="ML Predictor not initialized."
         )
     
+    semaphore = asyncio.Semaphore(settings.PREDICT_CONCURRENCY)
+    
+    async def _predict_one(employee: PredictionRequest):
+        async with semaphore:
+            return await predict_employee_metrics(employee)
+    
+    outcomes = await asyncio.gather(
+        *(_predict_one(employee) for employee in employees),
+        return_exceptions=True
+    )
+    
     results = []
-    for employee in employees:
-        try:
-            result = await predict_employee_metrics(employee)
-            results.append(result)
-        except Exception as e:
-            logger.error(f"Error predicting for {employee.employee_id}: {e}")
+    for employee, outcome in zip(employees, outcomes):
+        if isinstance(outcome, Exception):
+            logger.error(f"Error predicting for {employee.employee_id}: {outcome}")
             results.append({
                 "employee_id": employee.employee_id,
-                "error": str(e)
+                "error": str(outcome)
             })
+        else:
+            results.append(outcome)
     
     return results
 
@@ -285,38 +366,70 @@ async def get_model_info():
     }
 
 
+# Recommendation rules: (threshold, messages), first match wins per metric
+_BURNOUT_RULES = (
+    (0.7, (
+        "🚨 URGENT: Schedule immediate one-on-one meeting",
+        "Consider immediate workload reduction",
+        "Provide access to mental health resources",
+    )),
+    (0.5, (
+        "⚠️ Monitor closely - signs of stress detected",
+        "Review meeting schedule and task distribution",
+        "Encourage regular breaks and time off",
+    )),
+)
+
+_WELLBEING_RULES = (
+    (50, (
+        "🏥 Wellbeing support needed",
+        "Evaluate work-life balance concerns",
+        "Consider wellness program enrollment",
+    )),
+    (70, (
+        "📊 Monitor wellbeing trends",
+        "Promote healthy work practices",
+    )),
+)
+
+_EFFICIENCY_RULES = (
+    (50, (
+        "📉 Performance concerns detected",
+        "Identify blockers and skill gaps",
+        "Provide additional training or mentorship",
+    )),
+    (70, (
+        "💡 Opportunities for productivity improvement",
+        "Review task priorities and deadlines",
+    )),
+)
+
+_HEALTHY_RECOMMENDATIONS = (
+    "✅ Employee metrics are healthy",
+    "Continue current engagement practices",
+    "Recognize and reward good performance",
+)
+
+
 def _generate_recommendations(burnout_risk: float, wellbeing: float, efficiency: float) -> List[str]:
     """Generate actionable recommendations based on predictions"""
     recommendations = []
     
-    if burnout_risk > 0.7:
-        recommendations.append("🚨 URGENT: Schedule immediate one-on-one meeting")
-        recommendations.append("Consider immediate workload reduction")
-        recommendations.append("Provide access to mental health resources")
-    elif burnout_risk > 0.5:
-        recommendations.append("⚠️ Monitor closely - signs of stress detected")
-        recommendations.append("Review meeting schedule and task distribution")
-        recommendations.append("Encourage regular breaks and time off")
-    
-    if wellbeing < 50:
-        recommendations.append("🏥 Wellbeing support needed")
-        recommendations.append("Evaluate work-life balance concerns")
-        recommendations.append("Consider wellness program enrollment")
-    elif wellbeing < 70:
-        recommendations.append("📊 Monitor wellbeing trends")
-        recommendations.append("Promote healthy work practices")
+    # Burnout rules fire above the threshold
+    for threshold, messages in _BURNOUT_RULES:
+        if burnout_risk > threshold:
+            recommendations.extend(messages)
+            break
     
-    if efficiency < 50:
-        recommendations.append("📉 Performance concerns detected")
-        recommendations.append("Identify blockers and skill gaps")
-        recommendations.append("Provide additional training or mentorship")
-    elif efficiency < 70:
-        recommendations.append("💡 Opportunities for productivity improvement")
-        recommendations.append("Review task priorities and deadlines")
+    # Wellbeing and efficiency rules fire below the threshold
+    for threshold, messages in _WELLBEING_RULES:
+        if wellbeing < threshold:
+            recommendations.extend(messages)
+            break
     
-    if not recommendations:
-        recommendations.append("✅ Employee metrics are healthy")
-        recommendations.append("Continue current engagement practices")
-        recommendations.append("Recognize and reward good performance")
+    for threshold, messages in _EFFICIENCY_RULES:
+        if efficiency < threshold:
+            recommendations.extend(messages)
+            break
     
-    return recommendations
+    return recommendations or list(_HEALTHY_RECOMMENDATIONS)
@@ -2,18 +2,12 @@
 Employee Prediction Service
 Fetches employee data from Firebase and runs ML predictions
 """
-import sys
-from pathlib import Path
 from typing import Dict, Optional
 import logging
 
-# Add model directory to path
-model_path = Path(__file__).parent.parent.parent / "model" / "models" / "inference"
-sys.path.insert(0, str(model_path))
-
 try:
-    from predict import WorkforceAnalyticsPredictor
-    predictor = WorkforceAnalyticsPredictor()
+    from services.model_loader import get_predictor
+    predictor = get_predictor()
     logger = logging.getLogger(__name__)
     logger.info("✅ ML Predictor loaded successfully in service")
 except Exception as e:
@@ -22,6 +16,36 @@ except Exception as e:
     predictor = None
 
 
+# Firebase field -> (model feature, divisor) mapping, walked once per employee
+_FIELD_MAP = (
+    # Basic info
+    ('age', 'age', 1),
+    ('experienceYears', 'experience_years', 1),
+    # Work hours
+    ('workHoursPerDay', 'work_hours_per_day', 1),
+    ('overtimeHours', 'overtime_hours', 1),
+    ('loggedHours', 'hours_logged', 1),
+    # Attendance (percentages stored as 0-100 in Firebase)
+    ('punctuality', 'punctuality_score', 100),
+    ('attendance', 'attendance_rate', 100),
+    ('lateArrivals', 'late_arrivals', 1),
+    # Communication
+    ('emailsSent', 'emails_sent', 1),
+    ('emailsReceived', 'emails_received', 1),
+    ('messagesSent', 'messages_sent', 1),
+    ('messagesReceived', 'messages_received', 1),
+    # Meetings
+    ('meetingCount', 'meetings_per_week', 1),
+    ('meetingHours', 'meeting_hours', 1),
+    # Tasks
+    ('taskCompletion', 'task_completion_rate', 100),
+    ('tasksCompleted', 'tasks_completed_per_week', 1),
+    ('tasksAssigned', 'tasks_assigned', 1),
+)
+
+_ROLE_KEYS = ('Developer', 'Designer', 'Manager', 'QA Engineer', 'Senior Developer', 'Tech Lead')
+
+
 class EmployeePredictionService:
     """Service to fetch employee data and generate predictions"""
     
@@ -41,60 +65,17 @@ class EmployeePredictionService:
         features = {}
         
         # Map Firebase fields to model features
-        # Basic info
-        if 'age' in employee_data:
-            features['age'] = employee_data['age']
-        if 'experienceYears' in employee_data:
-            features['experience_years'] = employee_data['experienceYears']
-        
-        # Work hours
-        if 'workHoursPerDay' in employee_data:
-            features['work_hours_per_day'] = employee_data['workHoursPerDay']
-        if 'overtimeHours' in employee_data:
-            features['overtime_hours'] = employee_data['overtimeHours']
-        if 'loggedHours' in employee_data:
-            features['hours_logged'] = employee_data['loggedHours']
-        
-        # Attendance
-        if 'punctuality' in employee_data:
-            features['punctuality_score'] = employee_data['punctuality'] / 100
-        if 'attendance' in employee_data:
-            features['attendance_rate'] = employee_data['attendance'] / 100
-        if 'lateArrivals' in employee_data:
-            features['late_arrivals'] = employee_data['lateArrivals']
-        
-        # Communication
-        if 'emailsSent' in employee_data:
-            features['emails_sent'] = employee_data['emailsSent']
-        if 'emailsReceived' in employee_data:
-            features['emails_received'] = employee_data['emailsReceived']
-        if 'messagesSent' in employee_data:
-            features['messages_sent'] = employee_data['messagesSent']
-        if 'messagesReceived' in employee_data:
-            features['messages_received'] = employee_data['messagesReceived']
-        
-        # Meetings
-        if 'meetingCount' in employee_data:
-            features['meetings_per_week'] = employee_data['meetingCount']
-        if 'meetingHours' in employee_data:
-            features['meeting_hours'] = employee_data['meetingHours']
-        
-        # Tasks
-        if 'taskCompletion' in employee_data:
-            features['task_completion_rate'] = employee_data['taskCompletion'] / 100
-        if 'tasksCompleted' in employee_data:
-            features['tasks_completed_per_week'] = employee_data['tasksCompleted']
-        if 'tasksAssigned' in employee_data:
-            features['tasks_assigned'] = employee_data['tasksAssigned']
+        for firebase_key, feature_key, divisor in _FIELD_MAP:
+            value = employee_data.get(firebase_key)
+            if value is not None:
+                features[feature_key] = value / divisor if divisor != 1 else value
         
         # Role mapping
         role = employee_data.get('role', 'Developer')
-        features['role_Developer'] = 1 if role == 'Developer' else 0
-        features['role_Designer'] = 1 if role == 'Designer' else 0
-        features['role_Manager'] = 1 if role == 'Manager' else 0
-        features['role_QA Engineer'] = 1 if role == 'QA Engineer' else 0
-        features['role_Senior Developer'] = 1 if role == 'Senior Developer' else 0
-        features['role_Tech Lead'] = 1 if role == 'Tech Lead' else 0
+        features.update({
+            f'role_{role_key}': 1 if role == role_key else 0
+            for role_key in _ROLE_KEYS
+        })
         
         return features
     
@@ -0,0 +1,16 @@
+"""
+Shared ML Model Loader
+Makes the inference module importable once and exposes the shared predictors
+"""
+import sys
+from pathlib import Path
+
+# model/models/inference holds predict.py, which is not an installed package
+INFERENCE_DIR = Path(__file__).parent.parent.parent / "model" / "models" / "inference"
+
+if str(INFERENCE_DIR) not in sys.path:
+    sys.path.insert(0, str(INFERENCE_DIR))
+
+from predict import WorkforceAnalyticsPredictor, get_predictor  # noqa: E402
+
+__all__ = ["INFERENCE_DIR", "WorkforceAnalyticsPredictor", "get_predictor"]
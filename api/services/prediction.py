@@ -3,15 +3,162 @@ ML Prediction Service
 Loads trained models and makes predictions on employee features
 """
 import os
+import operator
 import joblib
 import pandas as pd
 import numpy as np
 from typing import Dict, List, Optional
 import logging
 from pathlib import Path
+from sklearn.preprocessing import StandardScaler
 
 logger = logging.getLogger(__name__)
 
+# Recent predict() results kept per service, keyed by the raw feature row
+PREDICTION_CACHE_SIZE = 1024
+
+
+# Score interpretation tables. Thresholds are lower bounds (score >= t moves
+# up a level); levels run from lowest to highest score.
+_PERFORMANCE_THRESHOLDS = np.array([0.5, 0.7])
+_PERFORMANCE_LEVELS = (
+    ('low', 'Below average - may need support', '⚠️'),
+    ('average', 'Average performance - meeting expectations', '➡️'),
+    ('high', 'High performance - exceeding expectations', '✅')
+)
+
+_BURNOUT_THRESHOLDS = np.array([0.4, 0.6])
+_BURNOUT_LEVELS = (
+    ('low', 'LOW RISK - Employee wellbeing appears healthy', '✅', (
+        'Maintain current work patterns',
+        'Continue regular check-ins',
+        'Recognize good performance'
+    )),
+    ('moderate', 'MODERATE RISK - Monitor closely and provide support', '⚠️', (
+        'Monitor workload and stress levels',
+        'Promote work-life balance',
+        'Ensure regular breaks',
+        'Check in during 1-on-1s'
+    )),
+    ('high', 'HIGH RISK - Immediate intervention recommended', '🚨', (
+        'Schedule immediate check-in with manager',
+        'Review workload distribution',
+        'Consider reducing meeting load',
+        'Encourage time off or mental health support'
+    ))
+)
+
+
+def _score_levels(rows: List[Dict], key: str, thresholds: np.ndarray) -> List[Optional[int]]:
+    """
+    Level index of each row's numeric score for the given thresholds
+
+    Returns None where the score is missing or not numeric (a class label).
+    NaN scores fall in the lowest level, as they fail every >= check.
+    """
+    scores = [row.get(key) for row in rows]
+    numeric = [isinstance(score, (int, float)) for score in scores]
+
+    values = np.array(
+        [score if is_numeric else np.nan for score, is_numeric in zip(scores, numeric)],
+        dtype=float
+    )
+    levels = np.searchsorted(thresholds, values, side='right')
+    levels[np.isnan(values)] = 0
+
+    return [
+        int(level) if is_numeric else None
+        for level, is_numeric in zip(levels, numeric)
+    ]
+
+
+def _build_interpretations(
+    predictions: Dict,
+    perf_level: Optional[int],
+    burnout_level: Optional[int]
+) -> Dict:
+    """Assemble the interpretation dictionary for one set of predictions"""
+    interpretations = {}
+
+    # Interpret performance score
+    if 'performance_score' in predictions:
+        perf = predictions['performance_score']
+
+        if perf_level is not None:
+            level, description, emoji = _PERFORMANCE_LEVELS[perf_level]
+            interpretations['performance'] = {
+                'level': level,
+                'description': description,
+                'emoji': emoji,
+                'score': float(perf)
+            }
+        else:
+            interpretations['performance'] = {
+                'level': str(perf),
+                'description': f'Performance level: {perf}',
+                'emoji': '📊'
+            }
+
+    # Interpret burnout risk
+    if 'burnout_risk_score' in predictions:
+        burnout = predictions['burnout_risk_score']
+
+        if burnout_level is not None:
+            level, description, emoji, recommendations = _BURNOUT_LEVELS[burnout_level]
+            interpretations['burnout'] = {
+                'level': level,
+                'description': description,
+                'emoji': emoji,
+                'score': float(burnout),
+                'recommendations': list(recommendations)
+            }
+        else:
+            interpretations['burnout'] = {
+                'level': str(burnout),
+                'description': f'Burnout risk level: {burnout}',
+                'emoji': '🔥'
+            }
+
+    # Add overall risk assessment
+    if 'burnout' in interpretations and 'performance' in interpretations:
+        burnout_level = interpretations['burnout']['level']
+        perf_level = interpretations['performance']['level']
+
+        if burnout_level == 'high':
+            interpretations['overall_status'] = {
+                'status': 'critical',
+                'message': 'Employee at high risk of burnout - immediate action needed',
+                'priority': 'urgent'
+            }
+        elif burnout_level == 'moderate' and perf_level == 'low':
+            interpretations['overall_status'] = {
+                'status': 'concerning',
+                'message': 'Employee showing signs of struggle - provide support',
+                'priority': 'high'
+            }
+        elif burnout_level == 'low' and perf_level == 'high':
+            interpretations['overall_status'] = {
+                'status': 'excellent',
+                'message': 'Employee thriving - maintain current trajectory',
+                'priority': 'normal'
+            }
+        else:
+            interpretations['overall_status'] = {
+                'status': 'stable',
+                'message': 'Employee in stable condition - continue monitoring',
+                'priority': 'normal'
+            }
+
+    return interpretations
+
+
+def _copy_predictions(predictions: Dict) -> Dict:
+    """Copy a prediction dictionary along with its nested class probabilities"""
+    return {
+        key: dict(value) if isinstance(value, dict) else value
+        for key, value in predictions.items()
+    }
+
 
 class PredictionService:
     """
@@ -32,9 +179,18 @@ class PredictionService:
         self.model_dir = Path(model_dir)
         self.models = {}
         self.label_encoders = {}
+        self._classes_str = {}
         self.scaler = None
         self.feature_names = None
 
+        # Fitted StandardScaler statistics, applied inline by _scale
+        self._scaler_mean = None
+        self._scaler_scale = None
+
+        # LRU of feature row bytes -> predictions; dicts keep insertion
+        # order, so the first key is the least recently used
+        self._prediction_cache: Dict[bytes, Dict] = {}
+
         # Target columns
         self.target_cols = [
             "performance_score",
@@ -44,13 +200,26 @@ class PredictionService:
         self._load_models()
 
     def _load_models(self):
-        """Load all trained models and the feature scaler"""
+        """
+        Load all trained models and the feature scaler
+
+        The scaler and models are memory-mapped (mmap_mode='r'), so their numpy
+        arrays are read-only and shared through the page cache between server
+        workers. They must not be modified after loading.
+        """
+        # Results from previously loaded models no longer apply
+        self._prediction_cache.clear()
+
         try:
             # Load feature scaler
             scaler_path = self.model_dir / "feature_scaler.pkl"
             if scaler_path.exists():
-                self.scaler = joblib.load(scaler_path)
+                self.scaler = joblib.load(scaler_path, mmap_mode='r')
                 logger.info("✅ Loaded feature scaler")
+
+                if isinstance(self.scaler, StandardScaler):
+                    self._scaler_mean = self.scaler.mean_ if self.scaler.with_mean else 0.0
+                    self._scaler_scale = self.scaler.scale_ if self.scaler.with_std else 1.0
             else:
                 logger.warning(f"⚠️ Feature scaler not found at {scaler_path}")
                 return
@@ -60,13 +229,14 @@ class PredictionService:
                 model_path = self.model_dir / f"model_{target}.pkl"
 
                 if model_path.exists():
-                    self.models[target] = joblib.load(model_path)
+                    self.models[target] = joblib.load(model_path, mmap_mode='r')
                     logger.info(f"✅ Loaded model for {target}")
 
                     # Try to load label encoder if it exists (for classification)
                     le_path = self.model_dir / f"label_encoder_{target}.pkl"
                     if le_path.exists():
                         self.label_encoders[target] = joblib.load(le_path)
+                        self._classes_str[target] = [str(cls) for cls in self.label_encoders[target].classes_]
                         logger.info(f"✅ Loaded label encoder for {target}")
                 else:
                     logger.warning(f"⚠️ Model not found for {target} at {model_path}")
@@ -98,6 +268,11 @@ class PredictionService:
                 'avg_break_length_minutes_per_week'
             ]
 
+            # Bulk lookups for turning a feature dict into a row
+            self._feature_getter = operator.itemgetter(*self.feature_names)
+            self._feature_name_set = frozenset(self.feature_names)
+            self._default_features = dict.fromkeys(self.feature_names, 0)
+
             logger.info(f"✅ Prediction service initialized with {len(self.models)} models")
 
         except Exception as e:
@@ -118,58 +293,38 @@ class PredictionService:
             if not self.models:
                 raise ValueError("No models loaded. Please train models first.")
 
-            # Convert features dict to DataFrame
+            # Scale features (dicts go straight to an array, missing ones as 0);
+            # a dashboard re-querying the same features is served from the cache
+            cache_key = None
             if isinstance(features, dict):
-                # Ensure all feature names are present
-                feature_values = []
-                for feature_name in self.feature_names:
-                    if feature_name not in features:
-                        logger.warning(f"⚠️ Missing feature: {feature_name}, using default 0")
-                        feature_values.append(0)
-                    else:
-                        feature_values.append(features[feature_name])
-
-                df = pd.DataFrame([feature_values], columns=self.feature_names)
+                X = self._feature_matrix([features])
+                cache_key = X.tobytes()
+                cached = self._prediction_cache.pop(cache_key, None)
+                if cached is not None:
+                    # Re-insert to mark as most recently used; callers get their
+                    # own copies so they cannot alter the cached entry
+                    self._prediction_cache[cache_key] = cached
+                    predictions = _copy_predictions(cached)
+                    return {
+                        'predictions': predictions,
+                        'interpretations': self._interpret_predictions(predictions),
+                        'status': 'success'
+                    }
+                X_scaled = self._scale(X)
             else:
-                df = pd.DataFrame([features])
-
-            # Scale features
-            X_scaled = self.scaler.transform(df)
+                X_scaled = self.scaler.transform(pd.DataFrame([features]))
 
             # Make predictions
-            predictions = {}
-
-            for target in self.target_cols:
-                if target not in self.models:
-                    logger.warning(f"⚠️ No model available for {target}")
-                    continue
-
-                model = self.models[target]
-                pred = model.predict(X_scaled)
-
-                # If classification model, decode predictions
-                if target in self.label_encoders:
-                    pred_decoded = self.label_encoders[target].inverse_transform(pred.astype(int))
-                    predictions[target] = pred_decoded[0]
-
-                    # Get probability predictions if available
-                    if hasattr(model, 'predict_proba'):
-                        proba = model.predict_proba(X_scaled)
-                        predictions[f"{target}_confidence"] = float(proba.max())
-
-                        # Store class probabilities
-                        classes = self.label_encoders[target].classes_
-                        predictions[f"{target}_probabilities"] = {
-                            str(cls): float(prob)
-                            for cls, prob in zip(classes, proba[0])
-                        }
-                else:
-                    # Regression model
-                    predictions[target] = float(pred[0])
+            predictions = self._predict_rows(X_scaled)[0]
 
             # Add interpretations
             interpretations = self._interpret_predictions(predictions)
 
+            if cache_key is not None:
+                self._prediction_cache[cache_key] = _copy_predictions(predictions)
+                if len(self._prediction_cache) > PREDICTION_CACHE_SIZE:
+                    self._prediction_cache.pop(next(iter(self._prediction_cache)), None)
+
             return {
                 'predictions': predictions,
                 'interpretations': interpretations,
@@ -183,6 +338,98 @@ class PredictionService:
                 'message': str(e)
             }
 
+    def _feature_matrix(self, features_list: List[Dict]) -> np.ndarray:
+        """
+        Stack feature dictionaries into one matrix in feature_names order
+
+        Args:
+            features_list: List of feature dictionaries
+
+        Returns:
+            Array of shape (len(features_list), len(feature_names)),
+            missing features filled with 0
+        """
+        X = np.empty((len(features_list), len(self.feature_names)))
+
+        for i, features in enumerate(features_list):
+            if self._feature_name_set.issubset(features):
+                X[i] = self._feature_getter(features)
+                continue
+
+            if logger.isEnabledFor(logging.WARNING):
+                missing = [name for name in self.feature_names if name not in features]
+                logger.warning("⚠️ Missing features: %s, using default 0", ", ".join(missing))
+            X[i] = self._feature_getter({**self._default_features, **features})
+
+        return X
+
+    def _scale(self, X: np.ndarray) -> np.ndarray:
+        """
+        Apply the feature scaler to a matrix in feature_names order
+
+        A StandardScaler is applied as (X - mean_) / scale_, which is what its
+        transform computes, without sklearn's per-call input validation. Other
+        scalers fitted on a DataFrame check column names, so they get a
+        zero-copy DataFrame view; otherwise the array is passed directly.
+        """
+        if self._scaler_scale is not None:
+            return (X - self._scaler_mean) / self._scaler_scale
+        if hasattr(self.scaler, 'feature_names_in_'):
+            return self.scaler.transform(pd.DataFrame(X, columns=self.feature_names, copy=False))
+        return self.scaler.transform(X)
+
+    def _predict_rows(self, X_scaled: np.ndarray) -> List[Dict]:
+        """
+        Run every target model once over a scaled feature matrix
+
+        The models get one shared contiguous float32 copy, the dtype sklearn's
+        tree ensembles compare against internally, so each model does not
+        make its own converted copy.
+
+        Args:
+            X_scaled: Scaled features, one row per employee
+
+        Returns:
+            List of per-row prediction dictionaries
+        """
+        rows = [{} for _ in range(len(X_scaled))]
+        X_model = np.ascontiguousarray(X_scaled, dtype=np.float32)
+
+        for target in self.target_cols:
+            if target not in self.models:
+                logger.warning(f"⚠️ No model available for {target}")
+                continue
+
+            model = self.models[target]
+            pred = model.predict(X_model)
+
+            # If classification model, decode predictions
+            if target in self.label_encoders:
+                pred_decoded = self.label_encoders[target].inverse_transform(pred.astype(int))
+
+                # Get probability predictions if available
+                proba = None
+                if hasattr(model, 'predict_proba'):
+                    proba = model.predict_proba(X_model)
+                    confidence = proba.max(axis=1).tolist()
+                    proba_rows = proba.tolist()
+                    classes = self._classes_str[target]
+
+                for i, row in enumerate(rows):
+                    row[target] = pred_decoded[i]
+
+                    if proba is not None:
+                        row[f"{target}_confidence"] = confidence[i]
+
+                        # Store class probabilities
+                        row[f"{target}_probabilities"] = dict(zip(classes, proba_rows[i]))
+            else:
+                # Regression model
+                for row, value in zip(rows, pred.astype(float).tolist()):
+                    row[target] = value
+
+        return rows
+
     def _interpret_predictions(self, predictions: Dict) -> Dict:
         """
         Provide human-readable interpretations of predictions
@@ -193,122 +440,28 @@ class PredictionService:
         Returns:
             Dictionary of interpretations
         """
-        interpretations = {}
-
-        # Interpret performance score
-        if 'performance_score' in predictions:
-            perf = predictions['performance_score']
-
-            if isinstance(perf, (int, float)):
-                if perf >= 0.7:
-                    interpretations['performance'] = {
-                        'level': 'high',
-                        'description': 'High performance - exceeding expectations',
-                        'emoji': '✅',
-                        'score': float(perf)
-                    }
-                elif perf >= 0.5:
-                    interpretations['performance'] = {
-                        'level': 'average',
-                        'description': 'Average performance - meeting expectations',
-                        'emoji': '➡️',
-                        'score': float(perf)
-                    }
-                else:
-                    interpretations['performance'] = {
-                        'level': 'low',
-                        'description': 'Below average - may need support',
-                        'emoji': '⚠️',
-                        'score': float(perf)
-                    }
-            else:
-                interpretations['performance'] = {
-                    'level': str(perf),
-                    'description': f'Performance level: {perf}',
-                    'emoji': '📊'
-                }
-
-        # Interpret burnout risk
-        if 'burnout_risk_score' in predictions:
-            burnout = predictions['burnout_risk_score']
-
-            if isinstance(burnout, (int, float)):
-                if burnout >= 0.6:
-                    interpretations['burnout'] = {
-                        'level': 'high',
-                        'description': 'HIGH RISK - Immediate intervention recommended',
-                        'emoji': '🚨',
-                        'score': float(burnout),
-                        'recommendations': [
-                            'Schedule immediate check-in with manager',
-                            'Review workload distribution',
-                            'Consider reducing meeting load',
-                            'Encourage time off or mental health support'
-                        ]
-                    }
-                elif burnout >= 0.4:
-                    interpretations['burnout'] = {
-                        'level': 'moderate',
-                        'description': 'MODERATE RISK - Monitor closely and provide support',
-                        'emoji': '⚠️',
-                        'score': float(burnout),
-                        'recommendations': [
-                            'Monitor workload and stress levels',
-                            'Promote work-life balance',
-                            'Ensure regular breaks',
-                            'Check in during 1-on-1s'
-                        ]
-                    }
-                else:
-                    interpretations['burnout'] = {
-                        'level': 'low',
-                        'description': 'LOW RISK - Employee wellbeing appears healthy',
-                        'emoji': '✅',
-                        'score': float(burnout),
-                        'recommendations': [
-                            'Maintain current work patterns',
-                            'Continue regular check-ins',
-                            'Recognize good performance'
-                        ]
-                    }
-            else:
-                interpretations['burnout'] = {
-                    'level': str(burnout),
-                    'description': f'Burnout risk level: {burnout}',
-                    'emoji': '🔥'
-                }
-
-        # Add overall risk assessment
-        if 'burnout' in interpretations and 'performance' in interpretations:
-            burnout_level = interpretations['burnout']['level']
-            perf_level = interpretations['performance']['level']
-
-            if burnout_level == 'high':
-                interpretations['overall_status'] = {
-                    'status': 'critical',
-                    'message': 'Employee at high risk of burnout - immediate action needed',
-                    'priority': 'urgent'
-                }
-            elif burnout_level == 'moderate' and perf_level == 'low':
-                interpretations['overall_status'] = {
-                    'status': 'concerning',
-                    'message': 'Employee showing signs of struggle - provide support',
-                    'priority': 'high'
-                }
-            elif burnout_level == 'low' and perf_level == 'high':
-                interpretations['overall_status'] = {
-                    'status': 'excellent',
-                    'message': 'Employee thriving - maintain current trajectory',
-                    'priority': 'normal'
-                }
-            else:
-                interpretations['overall_status'] = {
-                    'status': 'stable',
-                    'message': 'Employee in stable condition - continue monitoring',
-                    'priority': 'normal'
-                }
+        return self._interpret_batch([predictions])[0]
+
+    def _interpret_batch(self, rows: List[Dict]) -> List[Dict]:
+        """
+        Interpret many prediction dictionaries at once
 
-        return interpretations
+        Score levels for the whole batch are found with one searchsorted per
+        target, then each row is assembled from the static level tables.
+
+        Args:
+            rows: List of raw prediction dictionaries
+
+        Returns:
+            List of interpretation dictionaries, in the same order
+        """
+        perf_levels = _score_levels(rows, 'performance_score', _PERFORMANCE_THRESHOLDS)
+        burnout_levels = _score_levels(rows, 'burnout_risk_score', _BURNOUT_THRESHOLDS)
+
+        return [
+            _build_interpretations(predictions, perf_level, burnout_level)
+            for predictions, perf_level, burnout_level in zip(rows, perf_levels, burnout_levels)
+        ]
 
     def batch_predict(self, features_list: List[Dict]) -> List[Dict]:
         """
@@ -320,13 +473,30 @@ class PredictionService:
         Returns:
             List of prediction results
         """
-        results = []
+        if not features_list:
+            return []
+
+        # Score every record with one transform and one predict per model;
+        # anything unusual goes through predict so errors stay per record
+        if not self.models or not all(isinstance(features, dict) for features in features_list):
+            return [self.predict(features) for features in features_list]
 
-        for features in features_list:
-            result = self.predict(features)
-            results.append(result)
+        try:
+            X = self._feature_matrix(features_list)
+            X_scaled = self._scale(X)
+            rows = self._predict_rows(X_scaled)
+        except Exception as e:
+            logger.warning(f"⚠️ Batch prediction failed ({e}), predicting records individually")
+            return [self.predict(features) for features in features_list]
 
-        return results
+        return [
+            {
+                'predictions': predictions,
+                'interpretations': interpretations,
+                'status': 'success'
+            }
+            for predictions, interpretations in zip(rows, self._interpret_batch(rows))
+        ]
 
     def get_feature_importance(self, target: str = "burnout_risk_score") -> Dict:
         """
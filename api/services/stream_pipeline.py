@@ -4,18 +4,42 @@ Handles incoming API data streams with preprocessing and model inference
 """
 import asyncio
 import logging
+import os
 from typing import Dict, List, Optional, Any, Tuple
 from datetime import datetime
 import pandas as pd
 import numpy as np
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 import json
 
+from config import settings
 from utils.preprocessing import DataPreprocessor, DataAnonymizer
 from services.feature_extraction import FeatureExtractor
 
 logger = logging.getLogger(__name__)
 
+# Issue messages kept per data source in the validation report; noisy streams
+# can produce thousands, so the rest are only counted
+MAX_ISSUES_PER_TYPE = 32
+
+
+class _IssueLog:
+    """
+    Issues found while cleaning one data source
+    Counts every issue but keeps only the first MAX_ISSUES_PER_TYPE messages
+    """
+    
+    __slots__ = ("messages", "count")
+    
+    def __init__(self):
+        self.messages: List[str] = []
+        self.count = 0
+    
+    def append(self, message: str):
+        self.count += 1
+        if len(self.messages) < MAX_ISSUES_PER_TYPE:
+            self.messages.append(message)
+
 
 class DataValidator:
     """
@@ -26,7 +50,7 @@ class DataValidator:
     def validate_and_clean_stream(
         raw_data: Dict[str, Any],
         data_type: str
-    ) -> Tuple[Dict[str, Any], List[str]]:
+    ) -> Tuple[Dict[str, Any], List[str], int]:
         """
         Validate and clean incoming data stream
         
@@ -35,47 +59,42 @@ class DataValidator:
             data_type: Type of data (calendar, messages, tasks, etc.)
             
         Returns:
-            Tuple of (cleaned_data, list_of_issues)
+            Tuple of (cleaned_data, first MAX_ISSUES_PER_TYPE issues, total issue count)
         """
-        issues = []
+        issues = _IssueLog()
         cleaned = raw_data.copy()
         
         # Type-specific validation
         if data_type == "calendar_events":
-            cleaned, event_issues = DataValidator._clean_calendar_events(cleaned)
-            issues.extend(event_issues)
+            cleaned, issues = DataValidator._clean_calendar_events(cleaned)
             
         elif data_type == "teams_messages" or data_type == "slack_messages":
-            cleaned, msg_issues = DataValidator._clean_messages(cleaned)
-            issues.extend(msg_issues)
+            cleaned, issues = DataValidator._clean_messages(cleaned)
             
         elif data_type == "jira_tasks":
-            cleaned, task_issues = DataValidator._clean_tasks(cleaned)
-            issues.extend(task_issues)
+            cleaned, issues = DataValidator._clean_tasks(cleaned)
             
         elif data_type == "emails":
-            cleaned, email_issues = DataValidator._clean_emails(cleaned)
-            issues.extend(email_issues)
+            cleaned, issues = DataValidator._clean_emails(cleaned)
         
-        return cleaned, issues
+        return cleaned, issues.messages, issues.count
     
     @staticmethod
-    def _clean_calendar_events(events: List[Dict]) -> Tuple[List[Dict], List[str]]:
+    def _clean_calendar_events(events: List[Dict]) -> Tuple[List[Dict], _IssueLog]:
         """Clean calendar events data"""
-        issues = []
+        issues = _IssueLog()
         cleaned_events = []
         
         for idx, event in enumerate(events):
             try:
                 # Check required fields
-                if not event.get("start") or not event.get("end"):
+                start = event.get("start")
+                end = event.get("end")
+                if not start or not end:
                     issues.append(f"Event {idx}: Missing start/end time - SKIPPED")
                     continue
                 
                 # Validate date formats
-                start = event.get("start", {})
-                end = event.get("end", {})
-                
                 if isinstance(start, dict) and "dateTime" not in start:
                     issues.append(f"Event {idx}: Invalid start time format")
                     continue
@@ -101,17 +120,22 @@ class DataValidator:
         return cleaned_events, issues
     
     @staticmethod
-    def _clean_messages(messages: List[Dict]) -> Tuple[List[Dict], List[str]]:
+    def _clean_messages(messages: List[Dict]) -> Tuple[List[Dict], _IssueLog]:
         """Clean message data"""
-        issues = []
+        issues = _IssueLog()
         cleaned_messages = []
         
+        # One timestamp per batch; the index keeps generated IDs unique
+        generated_at = None
+        
         for idx, msg in enumerate(messages):
             try:
                 # Check required fields
                 if not msg.get("id"):
                     issues.append(f"Message {idx}: Missing ID - generating one")
-                    msg["id"] = f"generated_{idx}_{datetime.utcnow().timestamp()}"
+                    if generated_at is None:
+                        generated_at = datetime.utcnow().timestamp()
+                    msg["id"] = f"generated_{idx}_{generated_at}"
                 
                 if not msg.get("createdDateTime") and not msg.get("ts"):
                     issues.append(f"Message {idx}: Missing timestamp - SKIPPED")
@@ -131,9 +155,9 @@ class DataValidator:
         return cleaned_messages, issues
     
     @staticmethod
-    def _clean_tasks(tasks: List[Dict]) -> Tuple[List[Dict], List[str]]:
+    def _clean_tasks(tasks: List[Dict]) -> Tuple[List[Dict], _IssueLog]:
         """Clean task/issue data"""
-        issues = []
+        issues = _IssueLog()
         cleaned_tasks = []
         
         for idx, task in enumerate(tasks):
@@ -160,9 +184,9 @@ class DataValidator:
         return cleaned_tasks, issues
     
     @staticmethod
-    def _clean_emails(emails: List[Dict]) -> Tuple[List[Dict], List[str]]:
+    def _clean_emails(emails: List[Dict]) -> Tuple[List[Dict], _IssueLog]:
         """Clean email data"""
-        issues = []
+        issues = _IssueLog()
         cleaned_emails = []
         
         for idx, email in enumerate(emails):
@@ -186,6 +210,73 @@ class DataValidator:
         return cleaned_emails, issues
 
 
+def _preprocess_and_extract(
+    preprocessor: DataPreprocessor,
+    feature_extractor: FeatureExtractor,
+    cleaned_data: Dict[str, List[Dict]]
+) -> Tuple[Dict[str, int], Dict[str, float]]:
+    """
+    Preprocess cleaned data and extract features from it
+    
+    Returns:
+        Tuple of (preprocessed record counts by type, features)
+    """
+    # Stage 2: Preprocess and Anonymize
+    logger.info("🔐 Stage 2: Preprocessing and anonymizing")
+    
+    preprocessed_data = preprocessor.preprocess_all_data(
+        calendar_events=cleaned_data.get("calendar_events"),
+        teams_messages=cleaned_data.get("teams_messages"),
+        slack_messages=cleaned_data.get("slack_messages"),
+        emails=cleaned_data.get("emails"),
+        jira_issues=cleaned_data.get("jira_tasks")
+    )
+    
+    preprocessed_counts = {
+        "calendar_events": len(preprocessed_data.get("calendar_events", [])),
+        "teams_messages": len(preprocessed_data.get("teams_messages", [])),
+        "slack_messages": len(preprocessed_data.get("slack_messages", [])),
+        "emails": len(preprocessed_data.get("emails", [])),
+        "jira_issues": len(preprocessed_data.get("jira_issues", []))
+    }
+    
+    # Stage 3: Extract Features
+    logger.info("🔧 Stage 3: Extracting features")
+    
+    # Determine primary message source
+    message_source = "teams"
+    if preprocessed_data.get("slack_messages") and not preprocessed_data.get("teams_messages"):
+        message_source = "slack"
+    
+    # Combine messages for extraction
+    messages = preprocessed_data.get("teams_messages") or preprocessed_data.get("slack_messages")
+    
+    features = feature_extractor.extract_all_features(
+        calendar_events=preprocessed_data.get("calendar_events"),
+        messages=messages,
+        tasks=preprocessed_data.get("jira_issues"),
+        worklogs=None,  # Can be added if available
+        message_source=message_source,
+        task_source="jira"
+    )
+    
+    return preprocessed_counts, features
+
+
+# Preprocessor and feature extractor owned by a pipeline worker process
+_worker_stages = None
+
+
+def _preprocess_and_extract_in_worker(
+    cleaned_data: Dict[str, List[Dict]]
+) -> Tuple[Dict[str, int], Dict[str, float]]:
+    """Run stages 2-3 inside a pipeline worker process"""
+    global _worker_stages
+    if _worker_stages is None:
+        _worker_stages = (DataPreprocessor(), FeatureExtractor())
+    return _preprocess_and_extract(*_worker_stages, cleaned_data)
+
+
 class StreamPipeline:
     """
     Main pipeline for processing incoming data streams
@@ -198,8 +289,26 @@ class StreamPipeline:
         self.feature_extractor = FeatureExtractor()
         self.anonymizer = DataAnonymizer()
         
+        # Preprocessing and feature extraction run back to back on these threads
+        self._executor = ThreadPoolExecutor(
+            max_workers=os.cpu_count() or 1,
+            thread_name_prefix="pipeline"
+        )
+        
+        # Optionally on worker processes instead, clear of the GIL. Only the
+        # cleaned records go over; counts and features come back.
+        self._process_pool = None
+        if settings.PIPELINE_PROCESS_WORKERS > 0:
+            self._process_pool = ProcessPoolExecutor(max_workers=settings.PIPELINE_PROCESS_WORKERS)
+        
         logger.info("✅ Stream Pipeline initialized")
     
+    def shutdown(self):
+        """Stop the pipeline worker threads and processes"""
+        self._executor.shutdown(wait=False)
+        if self._process_pool is not None:
+            self._process_pool.shutdown(wait=False)
+    
     async def process_stream(
         self,
         raw_data: Dict[str, List[Dict]],
@@ -237,31 +346,40 @@ class StreamPipeline:
         # Stage 1: Validate and Clean
         logger.info("📋 Stage 1: Validating and cleaning data")
         cleaned_data = {}
-        all_issues = []
-        
-        for data_type, data_list in raw_data.items():
-            if data_list:
-                cleaned, issues = self.validator.validate_and_clean_stream(
-                    data_list, 
-                    data_type
-                )
-                cleaned_data[data_type] = cleaned
-                
-                validation_report["stages"][data_type] = {
-                    "original_count": len(data_list),
-                    "cleaned_count": len(cleaned),
-                    "issues": issues,
-                    "quality_score": (len(cleaned) / len(data_list) * 100) if data_list else 100
-                }
-                
-                all_issues.extend(issues)
-                
-                logger.info(
-                    f"  {data_type}: {len(data_list)} → {len(cleaned)} items "
-                    f"({len(issues)} issues)"
-                )
+        total_issues = 0
+        
+        # Each source is cleaned independently, off the event loop
+        loop = asyncio.get_running_loop()
+        sources = [(data_type, data_list) for data_type, data_list in raw_data.items() if data_list]
+        results = await asyncio.gather(*(
+            loop.run_in_executor(
+                self._executor,
+                self.validator.validate_and_clean_stream,
+                data_list,
+                data_type
+            )
+            for data_type, data_list in sources
+        ))
+        
+        for (data_type, data_list), (cleaned, issues, issue_count) in zip(sources, results):
+            cleaned_data[data_type] = cleaned
+            
+            validation_report["stages"][data_type] = {
+                "original_count": len(data_list),
+                "cleaned_count": len(cleaned),
+                "issues": issues,
+                "issue_count": issue_count,
+                "quality_score": (len(cleaned) / len(data_list) * 100) if data_list else 100
+            }
+            
+            total_issues += issue_count
+            
+            logger.info(
+                f"  {data_type}: {len(data_list)} → {len(cleaned)} items "
+                f"({issue_count} issues)"
+            )
         
-        validation_report["total_issues"] = len(all_issues)
+        validation_report["total_issues"] = total_issues
         
         # Calculate overall data quality score
         quality_scores = [
@@ -271,46 +389,23 @@ class StreamPipeline:
         if quality_scores:
             validation_report["data_quality_score"] = sum(quality_scores) / len(quality_scores)
         
-        # Stage 2: Preprocess and Anonymize
-        logger.info("🔐 Stage 2: Preprocessing and anonymizing")
-        
-        preprocessed_data = await asyncio.to_thread(
-            self.preprocessor.preprocess_all_data,
-            calendar_events=cleaned_data.get("calendar_events"),
-            teams_messages=cleaned_data.get("teams_messages"),
-            slack_messages=cleaned_data.get("slack_messages"),
-            emails=cleaned_data.get("emails"),
-            jira_issues=cleaned_data.get("jira_tasks")
-        )
-        
-        validation_report["preprocessing"] = {
-            "calendar_events": len(preprocessed_data.get("calendar_events", [])),
-            "teams_messages": len(preprocessed_data.get("teams_messages", [])),
-            "slack_messages": len(preprocessed_data.get("slack_messages", [])),
-            "emails": len(preprocessed_data.get("emails", [])),
-            "jira_issues": len(preprocessed_data.get("jira_issues", []))
-        }
-        
-        # Stage 3: Extract Features
-        logger.info("🔧 Stage 3: Extracting features")
-        
-        # Determine primary message source
-        message_source = "teams"
-        if preprocessed_data.get("slack_messages") and not preprocessed_data.get("teams_messages"):
-            message_source = "slack"
-        
-        # Combine messages for extraction
-        messages = preprocessed_data.get("teams_messages") or preprocessed_data.get("slack_messages")
-        
-        features = await asyncio.to_thread(
-            self.feature_extractor.extract_all_features,
-            calendar_events=preprocessed_data.get("calendar_events"),
-            messages=messages,
-            tasks=preprocessed_data.get("jira_issues"),
-            worklogs=None,  # Can be added if available
-            message_source=message_source,
-            task_source="jira"
-        )
+        # Stages 2-3 are CPU-bound and run as one job on the pipeline executor
+        if self._process_pool is None:
+            preprocessed_counts, features = await loop.run_in_executor(
+                self._executor,
+                _preprocess_and_extract,
+                self.preprocessor,
+                self.feature_extractor,
+                cleaned_data
+            )
+        else:
+            preprocessed_counts, features = await loop.run_in_executor(
+                self._process_pool,
+                _preprocess_and_extract_in_worker,
+                cleaned_data
+            )
+        
+        validation_report["preprocessing"] = preprocessed_counts
         
         validation_report["feature_extraction"] = {
             "total_features": len(features),
@@ -360,7 +455,19 @@ class StreamPipeline:
         Prepare extracted features for model inference
         Handles missing values and format conversion
         """
-        # Ensure all numeric values
+        # Convert every value in one bulk pass; None means missing and becomes 0
+        keys = list(features)
+        try:
+            values = np.array(
+                [0.0 if value is None else value for value in features.values()],
+                dtype=np.float64
+            )
+            if values.ndim == 1:
+                return dict(zip(keys, values.tolist()))
+        except (ValueError, TypeError):
+            pass
+        
+        # Some value is not numeric; convert key by key so only that one is zeroed
         model_features = {}
         
         for key, value in features.items():
@@ -392,3 +499,12 @@ def get_stream_pipeline() -> StreamPipeline:
         _stream_pipeline = StreamPipeline()
     
     return _stream_pipeline
+
+
+def shutdown_stream_pipeline():
+    """Release the global stream pipeline's worker threads, if it was created"""
+    global _stream_pipeline
+    
+    if _stream_pipeline is not None:
+        _stream_pipeline.shutdown()
+        _stream_pipeline = None
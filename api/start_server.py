@@ -10,17 +10,21 @@ def main():
     port = int(os.getenv('PORT', 8000))
     workers = int(os.getenv('WEB_CONCURRENCY', 1))
     
-    # Run with uvicorn workers
-    os.system(
-        f"gunicorn main:app "
-        f"--worker-class uvicorn.workers.UvicornWorker "
-        f"--bind 0.0.0.0:{port} "
-        f"--workers {workers} "
-        f"--timeout 120 "
-        f"--log-level info "
-        f"--access-logfile - "
-        f"--error-logfile -"
-    )
+    # Run with uvicorn workers. exec replaces this process with gunicorn, so
+    # there is no shell or idle Python parent and SIGTERM reaches gunicorn
+    # directly. --preload imports the app once in the master before forking.
+    args = [
+        "gunicorn", "main:app",
+        "--worker-class", "uvicorn.workers.UvicornWorker",
+        "--bind", f"0.0.0.0:{port}",
+        "--workers", str(workers),
+        "--timeout", "120",
+        "--log-level", "info",
+        "--access-logfile", "-",
+        "--error-logfile", "-",
+        "--preload"
+    ]
+    os.execvp(args[0], args)
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,10 @@
+"""
+Test configuration: make the api package modules importable as the app imports them
+"""
+import sys
+from pathlib import Path
+
+API_DIR = Path(__file__).parent.parent
+
+if str(API_DIR) not in sys.path:
+    sys.path.insert(0, str(API_DIR))
@@ -0,0 +1,90 @@
+"""
+Tests for the batching inference service
+"""
+import asyncio
+
+import pytest
+
+from services.parallel_inference import BatchingInferenceService, get_inference_service
+
+
+class RecordingPredictor:
+    """Stand-in predictor that records each batch and scores records by their id"""
+    
+    def __init__(self):
+        self.batches = []
+    
+    def predict_all_batch(self, records, timings=None):
+        self.batches.append(list(records))
+        if timings is not None:
+            timings.update(burnout_risk=1.0, wellbeing=2.0, efficiency=3.0)
+        return [_expected_scores(record["id"]) for record in records]
+
+
+def _expected_scores(employee_id: int):
+    return {"burnout_risk": employee_id / 100, "wellbeing": float(employee_id), "efficiency": -float(employee_id)}
+
+
+def test_concurrent_requests_are_scored_in_one_batch():
+    predictor = RecordingPredictor()
+    service = BatchingInferenceService(predictor)
+    n = 20
+    
+    async def run():
+        return await asyncio.gather(*(service.predict({"id": i}) for i in range(n)))
+    
+    results = asyncio.run(run())
+    
+    assert len(predictor.batches) == 1
+    assert [record["id"] for record in predictor.batches[0]] == list(range(n))
+    for i, (scores, timings) in enumerate(results):
+        assert scores == _expected_scores(i)
+        assert timings == {"burnout_risk": 1.0, "wellbeing": 2.0, "efficiency": 3.0}
+
+
+class FailingPredictor(RecordingPredictor):
+    """Predictor that rejects any batch containing a record marked bad"""
+    
+    def predict_all_batch(self, records, timings=None):
+        if any(record.get("bad") for record in records):
+            self.batches.append(list(records))
+            raise ValueError("malformed features")
+        return super().predict_all_batch(records, timings)
+
+
+def test_bad_record_only_fails_its_own_request():
+    predictor = FailingPredictor()
+    service = BatchingInferenceService(predictor)
+    records = [{"id": 0}, {"id": 1, "bad": True}, {"id": 2}]
+    
+    async def run():
+        return await asyncio.gather(
+            *(service.predict(record) for record in records),
+            return_exceptions=True
+        )
+    
+    results = asyncio.run(run())
+    
+    assert results[0][0] == _expected_scores(0)
+    assert isinstance(results[1], ValueError)
+    assert results[2][0] == _expected_scores(2)
+
+
+def test_cached_scores_are_not_shared_with_callers():
+    service = get_inference_service()
+    if not service.models_loaded:
+        pytest.skip("models not available")
+    features = {"work_hours_per_day": 9.5, "overtime_hours": 6, "role_Developer": 1}
+    
+    async def run():
+        scores, timings = await service._score(features)
+        expected = dict(scores)
+        cached_scores, cached_timings = await service._score(features)
+        cached_scores["burnout_risk"] = -1.0
+        cached_timings["burnout_risk"] = -1.0
+        return expected, await service._score(features)
+    
+    expected, (scores, timings) = asyncio.run(run())
+    
+    assert scores == expected
+    assert timings["burnout_risk"] == 0.0
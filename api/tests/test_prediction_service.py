@@ -0,0 +1,52 @@
+"""
+Tests for the prediction service cache
+"""
+import joblib
+import numpy as np
+import pytest
+from sklearn.ensemble import RandomForestClassifier, RandomForestRegressor
+from sklearn.preprocessing import LabelEncoder, StandardScaler
+
+from services.prediction import PredictionService
+
+
+@pytest.fixture
+def service(tmp_path):
+    rng = np.random.default_rng(0)
+    X = rng.normal(size=(60, 23))
+    joblib.dump(StandardScaler().fit(X), tmp_path / "feature_scaler.pkl")
+
+    joblib.dump(
+        RandomForestRegressor(n_estimators=5, random_state=0).fit(X, rng.uniform(1, 5, 60)),
+        tmp_path / "model_performance_score.pkl"
+    )
+    encoder = LabelEncoder().fit(["high", "low", "medium"])
+    labels = encoder.transform(rng.choice(["high", "low", "medium"], 60))
+    joblib.dump(
+        RandomForestClassifier(n_estimators=5, random_state=0).fit(X, labels),
+        tmp_path / "model_burnout_risk_score.pkl"
+    )
+    joblib.dump(encoder, tmp_path / "label_encoder_burnout_risk_score.pkl")
+
+    return PredictionService(model_dir=str(tmp_path))
+
+
+def test_cached_predictions_are_not_shared_with_callers(service):
+    features = {name: float(i) for i, name in enumerate(service.feature_names)}
+
+    first = service.predict(features)
+    expected = {
+        key: dict(value) if isinstance(value, dict) else value
+        for key, value in first['predictions'].items()
+    }
+    first['predictions']['burnout_risk_score_probabilities']['high'] = 999
+
+    cached = service.predict(features)
+    cached['predictions']['performance_score'] = -1.0
+    cached['predictions']['burnout_risk_score_probabilities']['low'] = 999
+    cached['interpretations'].clear()
+
+    result = service.predict(features)
+
+    assert result['predictions'] == expected
+    assert result['interpretations']
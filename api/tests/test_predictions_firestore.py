@@ -0,0 +1,70 @@
+"""
+Tests for the /predict endpoint
+"""
+import json
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from routers import predictions_firestore
+from routers.predictions_firestore import EmployeeFeatures
+from services.model_loader import INFERENCE_DIR
+
+
+@pytest.fixture(scope="module")
+def client():
+    if predictions_firestore.predictor is None:
+        pytest.skip("models not available")
+    app = FastAPI()
+    app.include_router(predictions_firestore.router)
+    return TestClient(app)
+
+
+def _predict(client, features):
+    response = client.post("/predict", json={"employee_id": "EMP001", "features": features})
+    assert response.status_code == 200
+    return response.json()
+
+
+def test_every_schema_field_is_a_model_feature():
+    feature_columns = json.loads((INFERENCE_DIR.parent / "feature_columns.json").read_text())
+    fields = EmployeeFeatures.model_construct(
+        **{name: 1 for name in EmployeeFeatures.model_fields}
+    ).model_dump(by_alias=True)
+
+    assert set(fields) <= set(feature_columns)
+
+
+def test_different_features_give_different_predictions(client):
+    light = _predict(client, {"emails_sent": 10, "meetings_per_week": 5, "commits_per_week": 20})
+    heavy = _predict(client, {"emails_sent": 200, "meetings_per_week": 25, "commits_per_week": 0})
+
+    assert (light["burnout_risk"], light["efficiency_score"]) != (heavy["burnout_risk"], heavy["efficiency_score"])
+
+
+def test_multi_word_role_reaches_the_model(client):
+    features = {"emails_sent": 200, "meetings_per_week": 25, "commits_per_week": 0}
+    developer = _predict(client, {**features, "role_Developer": 1})
+    tech_lead = _predict(client, {**features, "role_Tech_Lead": 1})
+
+    assert developer["burnout_risk"] != tech_lead["burnout_risk"]
+
+
+@pytest.mark.parametrize("features, provided", [
+    ({"emails_sent": 1}, 1),
+    ({"work_hours_per_day": 11, "overtime_hours": 14}, 2),
+    ({"work_hours_per_day": 11, "role_Manager": 1}, 2),
+])
+def test_insufficient_data_reports_the_gated_count(client, features, provided):
+    result = _predict(client, features)
+
+    assert result["data_completeness"] == "insufficient"
+    assert result["provided_features"] == provided
+    assert result["imputed_features"] == len(predictions_firestore.predictor.feature_columns) - provided
+
+
+def test_unused_keys_do_not_pass_the_gate(client):
+    features = {"emails_sent": 1, "not_a_feature": 2, "also_not_a_feature": 3}
+
+    assert predictions_firestore._count_provided_features(features) == 1
@@ -0,0 +1,41 @@
+"""
+orjson request parsing and response rendering for FastAPI routes
+"""
+from typing import Any, Callable
+
+import orjson
+from fastapi import Request, Response
+from fastapi.responses import JSONResponse
+from fastapi.routing import APIRoute
+
+
+class ORJSONRequest(Request):
+    """Request whose JSON body is decoded with orjson"""
+
+    async def json(self) -> Any:
+        if not hasattr(self, "_json"):
+            # orjson.JSONDecodeError subclasses json.JSONDecodeError, so
+            # FastAPI still reports malformed bodies as validation errors
+            self._json = orjson.loads(await self.body())
+        return self._json
+
+
+class ORJSONResponse(JSONResponse):
+    """JSON response rendered with orjson (numpy values serialized natively)"""
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(
+            content, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        )
+
+
+class ORJSONRoute(APIRoute):
+    """Route that parses JSON request bodies with orjson"""
+
+    def get_route_handler(self) -> Callable:
+        original_route_handler = super().get_route_handler()
+
+        async def route_handler(request: Request) -> Response:
+            return await original_route_handler(ORJSONRequest(request.scope, request.receive))
+
+        return route_handler
@@ -1,23 +1,60 @@
 from flask import Flask, jsonify, request
+from flask.json.provider import JSONProvider
+from flask_compress import Compress
 from flask_cors import CORS
 from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy import desc, exists, func, insert, literal, null, or_, select, union_all
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.schema import CreateIndex
 from werkzeug.security import generate_password_hash, check_password_hash
 import os
 from dotenv import load_dotenv
 import uuid
+import time
+import threading
+import hashlib
 from datetime import datetime
 import re
 import asyncio
+from bisect import bisect_right
+from functools import lru_cache
+from decimal import Decimal
+import numpy as np
+import orjson
+from concurrent.futures import ThreadPoolExecutor
+import redis
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 load_dotenv()
 
 # ==================== INPUT VALIDATION UTILITIES ====================
 
+_EMAIL_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+# Allow digits, spaces, dashes, and parentheses
+_PHONE_RE = re.compile(r'^[\d\s\-\+\(\)]{10,}$')
+# Allow letters, spaces, hyphens, and apostrophes
+_NAME_RE = re.compile(r'^[a-zA-Z\s\-\']+$')
+
+# Verdicts are memoized for inputs up to the longest field we accept;
+# anything longer is rejected later anyway and is not worth keeping
+_VALIDATION_CACHE_MAX_LENGTH = 120
+
+@lru_cache(maxsize=4096)
+def _matches_cached(pattern, value):
+    return pattern.match(value) is not None
+
+def _matches(pattern, value):
+    """Whether a validation pattern matches, from the cache for short inputs"""
+    if len(value) > _VALIDATION_CACHE_MAX_LENGTH:
+        return pattern.match(value) is not None
+    return _matches_cached(pattern, value)
+
 def validate_email(email):
     """Validate email format"""
-    pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-    return re.match(pattern, email) is not None
+    return _matches(_EMAIL_RE, email)
 
 def validate_password(password):
     """
@@ -34,9 +71,7 @@ def validate_phone(phone):
     """Validate phone number (basic format)"""
     if not phone:
         return True  # Phone is optional
-    # Allow digits, spaces, dashes, and parentheses
-    pattern = r'^[\d\s\-\+\(\)]{10,}$'
-    return re.match(pattern, phone) is not None
+    return _matches(_PHONE_RE, phone)
 
 def validate_name(name):
     """Validate name format"""
@@ -44,8 +79,7 @@ def validate_name(name):
         return False, "Name cannot be empty"
     if len(name) > 120:
         return False, "Name cannot exceed 120 characters"
-    # Allow letters, spaces, hyphens, and apostrophes
-    if not re.match(r'^[a-zA-Z\s\-\']+$', name):
+    if not _matches(_NAME_RE, name):
         return False, "Name can only contain letters, spaces, hyphens, and apostrophes"
     return True, None
 
@@ -61,21 +95,59 @@ def validate_string_field(value, field_name, max_length=120, required=False):
 
     return True, None
 
+# ==================== JSON ====================
+
+def _orjson_default(obj):
+    """Serialize the types orjson does not handle natively"""
+    if isinstance(obj, Decimal):
+        return str(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+class ORJSONProvider(JSONProvider):
+    """
+    JSON provider backed by orjson, used by jsonify and request.get_json
+    Responses are written straight from orjson's bytes
+    """
+    option = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, default=_orjson_default, option=self.option).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(
+            orjson.dumps(obj, default=_orjson_default, option=self.option),
+            mimetype='application/json'
+        )
+
 app = Flask(__name__)
+app.json = ORJSONProvider(app)
 CORS(app)
 
+# Compress JSON bodies over 1 KB (analytics payloads), Brotli when the client accepts it
+app.config['COMPRESS_ALGORITHM'] = ['br', 'gzip']
+app.config['COMPRESS_MIN_SIZE'] = 1024
+Compress(app)
+
 # Ensure all responses are JSON
 @app.before_request
 def before_request():
     pass
 
+# A non-JSON error body has no JSON to carry over, so the replacement is always this
+_GENERIC_ERROR_BODY = orjson.dumps({'error': 'An error occurred'})
+
 @app.after_request
 def after_request(response):
     # Ensure Content-Type is JSON for all responses
-    if response.status_code >= 400:
-        if response.content_type and 'application/json' not in response.content_type:
-            response.data = jsonify({'error': response.get_json() or 'An error occurred'}).get_data()
-            response.content_type = 'application/json'
+    if response.status_code < 400:
+        return response
+    if response.content_type and 'application/json' not in response.content_type:
+        response.data = _GENERIC_ERROR_BODY
+        response.content_type = 'application/json'
     return response
 
 # Error handler for bad requests
@@ -97,13 +169,17 @@ def server_error(e):
 database_url = os.getenv('DATABASE_URL', None)
 
 # If no DATABASE_URL is set, use SQLite for development
-if not database_url or database_url.startswith('sqlite'):
+if not database_url:
     database_url = 'sqlite:///workforce.db'
 
 app.config['SQLALCHEMY_DATABASE_URI'] = database_url
 app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
 db = SQLAlchemy(app)
 
+# scrypt runs in OpenSSL through hashlib; named explicitly so new hashes do not
+# depend on the Werkzeug version's default. Existing hashes of any method still verify.
+PASSWORD_HASH_METHOD = 'scrypt'
+
 # Supervisor Model
 class Supervisor(db.Model):
     __tablename__ = 'supervisors'
@@ -118,22 +194,17 @@ class Supervisor(db.Model):
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
     updated_at = db.Column(db.DateTime, default=datetime.utcnow)
 
+    # Emails are stored lowercase; this index serves lookups on lower(email)
+    __table_args__ = (db.Index('ix_supervisors_email_lower', db.func.lower(email), unique=True),)
+
     def check_password(self, password):
         return check_password_hash(self.password_hash, password)
 
     def set_password(self, password):
-        self.password_hash = generate_password_hash(password)
+        self.password_hash = generate_password_hash(password, method=PASSWORD_HASH_METHOD)
 
     def to_dict(self):
-        return {
-            'id': self.id,
-            'name': self.name,
-            'email': self.email,
-            'role': 'supervisor',
-            'department': self.department,
-            'phone': self.phone,
-            'is_active': self.is_active,
-        }
+        return user_dict('supervisor', self.id, self.name, self.email, self.department, self.phone, self.is_active)
 
 # Member Model
 class Member(db.Model):
@@ -148,36 +219,206 @@ class Member(db.Model):
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
     updated_at = db.Column(db.DateTime, default=datetime.utcnow)
 
+    # Emails are stored lowercase; this index serves lookups on lower(email)
+    __table_args__ = (db.Index('ix_members_email_lower', db.func.lower(email), unique=True),)
+
     def check_password(self, password):
         return check_password_hash(self.password_hash, password)
 
     def set_password(self, password):
-        self.password_hash = generate_password_hash(password)
+        self.password_hash = generate_password_hash(password, method=PASSWORD_HASH_METHOD)
 
     def to_dict(self):
-        return {
-            'id': self.id,
-            'name': self.name,
-            'email': self.email,
-            'role': 'member',
-            'phone': self.phone,
-            'is_active': self.is_active,
-        }
+        return user_dict('member', self.id, self.name, self.email, None, self.phone, self.is_active)
+
+# ==================== USER IDS ====================
+
+def uuid7():
+    """
+    Time-ordered UUID (version 7): 48-bit millisecond timestamp, then random bits
+    Same 36-character form as uuid4, but new primary keys land at the end of the
+    index instead of on random pages
+    """
+    timestamp_ms = time.time_ns() // 1_000_000
+    rand = int.from_bytes(os.urandom(10), 'big')
+    value = (
+        (timestamp_ms & 0xFFFF_FFFF_FFFF) << 80
+        | 0x7 << 76                                  # version
+        | ((rand >> 62) & 0xFFF) << 64
+        | 0b10 << 62                                 # RFC 4122 variant
+        | rand & 0x3FFF_FFFF_FFFF_FFFF
+    )
+    return uuid.UUID(int=value)
+
+# ==================== USER LOOKUP ====================
+
+def find_users_by_email(email):
+    """
+    Look up a lowercased email in both user tables with one query
+    Returns matching rows (supervisors first) with the to_dict fields,
+    password_hash and role; department is None for members
+    """
+    supervisors = select(
+        Supervisor.id, Supervisor.name, Supervisor.email, Supervisor.password_hash,
+        Supervisor.department, Supervisor.phone, Supervisor.is_active,
+        literal('supervisor').label('role')
+    ).where(func.lower(Supervisor.email) == email)
+    members = select(
+        Member.id, Member.name, Member.email, Member.password_hash,
+        null().label('department'), Member.phone, Member.is_active,
+        literal('member').label('role')
+    ).where(func.lower(Member.email) == email)
+
+    return db.session.execute(union_all(supervisors, members).order_by(desc('role'))).all()
+
+def user_dict(role, user_id, name, email, department, phone, is_active):
+    """
+    The user dictionary returned to the frontend; department is only
+    included for supervisors. Shared by the models' to_dict and the
+    login/register paths that work from plain column values.
+    """
+    user = {
+        'id': user_id,
+        'name': name,
+        'email': email,
+        'role': role,
+    }
+    if role == 'supervisor':
+        user['department'] = department
+    user['phone'] = phone
+    user['is_active'] = is_active
+    return user
+
+def user_row_to_dict(row):
+    """User dictionary for a find_users_by_email row"""
+    return user_dict(row.role, row.id, row.name, row.email, row.department, row.phone, row.is_active)
+
+def user_exists(user_id):
+    """Check both user tables for an id with one query"""
+    return db.session.query(or_(
+        exists().where(Supervisor.id == user_id),
+        exists().where(Member.id == user_id)
+    )).scalar()
+
+def email_registered(email):
+    """Check both user tables for a lowercased email with one query"""
+    return db.session.query(or_(
+        exists().where(func.lower(Supervisor.email) == email),
+        exists().where(func.lower(Member.email) == email)
+    )).scalar()
+
+# Dialects whose INSERT supports ON CONFLICT DO NOTHING
+_CONFLICT_SKIPPING_INSERTS = {
+    'postgresql': postgresql.insert,
+    'sqlite': sqlite.insert,
+}
+
+# Tables whose unique lower(email) index is in place, set by ensure_email_index at startup
+_email_index_ready = {}
+
+def insert_new_user(model, values):
+    """
+    Insert a user row unless its id or email is already taken
+    Returns whether the row was inserted. With the table's lower(email) index
+    in place the unique indexes decide, so two concurrent registrations for
+    one email cannot both succeed; on other databases a conflict raises
+    IntegrityError instead. Without that index the insert is made
+    conditional on the email being free.
+    """
+    if not _email_index_ready.get(model.__tablename__):
+        return _insert_user_if_email_free(model, values)
+
+    conflict_skipping_insert = _CONFLICT_SKIPPING_INSERTS.get(db.engine.dialect.name)
+    if conflict_skipping_insert is None:
+        db.session.execute(insert(model).values(**values))
+        return True
+
+    result = db.session.execute(conflict_skipping_insert(model).values(**values).on_conflict_do_nothing())
+    return result.rowcount == 1
+
+def _insert_user_if_email_free(model, values):
+    """
+    Insert a user row only if no row has its email in any case, as one
+    INSERT ... SELECT ... WHERE NOT EXISTS; SQLite runs that under its write
+    lock. On PostgreSQL two such statements could both see the email free,
+    so a transaction-scoped advisory lock on the email serializes them first.
+    """
+    email = values['email'].lower()
+    if db.engine.dialect.name == 'postgresql':
+        db.session.execute(select(func.pg_advisory_xact_lock(func.hashtext(email))))
+
+    columns = model.__table__.c
+    row = select(*(literal(value, columns[name].type).label(name) for name, value in values.items()))
+    email_free = ~exists().where(func.lower(model.email) == email)
+    result = db.session.execute(insert(model).from_select(list(values), row.where(email_free)))
+    return result.rowcount == 1
+
+# ==================== EMAIL INDEX MIGRATION ====================
+
+def find_duplicate_emails(model):
+    """(lowercased email, row count) for emails stored more than once in a user table, ignoring case"""
+    lowered = func.lower(model.email)
+    return db.session.execute(
+        select(lowered, func.count()).group_by(lowered).having(func.count() > 1)
+    ).all()
+
+def ensure_email_index(model):
+    """
+    Create a user table's unique lower(email) index when it is missing
+    db.create_all() only builds indexes together with new tables, so databases
+    created before the index was declared get it here. Emails that differ only
+    in case would make the index fail; they are reported and the index is
+    skipped until they are merged. Returns whether the index is in place.
+    """
+    index = next(ix for ix in model.__table__.indexes if ix.name.endswith('_email_lower'))
+
+    duplicates = find_duplicate_emails(model)
+    if duplicates:
+        app.logger.error(
+            '%s has %d emails registered more than once in different case (%s); '
+            'merge them, then restart to create %s',
+            model.__tablename__, len(duplicates),
+            ', '.join(f'{email} x{count}' for email, count in duplicates), index.name
+        )
+        return False
+
+    try:
+        with db.engine.begin() as conn:
+            conn.execute(CreateIndex(index, if_not_exists=True))
+    except IntegrityError:
+        # A mixed-case duplicate was registered after the check above
+        app.logger.error('Could not create %s: duplicate emails in %s', index.name, model.__tablename__)
+        return False
+    return True
 
 # Initialize database
 with app.app_context():
     db.create_all()
+    for user_model in (Supervisor, Member):
+        _email_index_ready[user_model.__tablename__] = ensure_email_index(user_model)
+    # Drop the connection used here so preforked server workers never share it
+    db.engine.dispose()
+
+def read_json_body():
+    """
+    Decode the request body straight from its bytes with orjson, without
+    caching it on the request; returns None when it is empty or not valid JSON
+    """
+    try:
+        return orjson.loads(request.get_data(cache=False))
+    except orjson.JSONDecodeError:
+        return None
 
 @app.route('/api/login', methods=['POST'])
 def login():
     """Authenticate user (Supervisor or Member) and return user data"""
     try:
-        data = request.get_json()
+        data = read_json_body()
 
         if not data:
             return jsonify({'error': 'No JSON data provided'}), 400
 
-        email = data.get('email', '').strip()
+        email = data.get('email', '').strip().lower()
         password = data.get('password', '').strip()
 
         # Validate email and password are provided
@@ -194,31 +435,28 @@ def login():
         if len(email) > 120:
             return jsonify({'error': 'Email is too long'}), 400
 
-        # Try to find supervisor first
-        supervisor = Supervisor.query.filter_by(email=email).first()
-        if supervisor and supervisor.check_password(password):
-            return jsonify(supervisor.to_dict()), 200
-
-        # Try to find member
-        member = Member.query.filter_by(email=email).first()
-        if member and member.check_password(password):
-            return jsonify(member.to_dict()), 200
+        # Check supervisor first, then member, from a single lookup
+        for user in find_users_by_email(email):
+            if check_password_hash(user.password_hash, password):
+                return jsonify(user_row_to_dict(user)), 200
 
         # Generic error message for security (don't reveal if email exists)
         return jsonify({'error': 'Invalid email or password'}), 401
     except Exception as e:
         return jsonify({'error': 'An unexpected error occurred'}), 500
 
+EMAIL_TAKEN_ERROR = 'This email is already registered. Please use a different email or try logging in'
+
 @app.route('/api/register', methods=['POST'])
 def register():
     """Register a new user (Supervisor or Member)"""
     try:
-        data = request.get_json()
+        data = read_json_body()
 
         if not data:
             return jsonify({'error': 'No JSON data provided'}), 400
 
-        email = data.get('email', '').strip()
+        email = data.get('email', '').strip().lower()
         password = data.get('password', '').strip()
         name = data.get('name', '').strip()
         role = data.get('role', 'member').lower()  # 'supervisor' or 'member'
@@ -263,43 +501,43 @@ def register():
         if role not in ['supervisor', 'member']:
             return jsonify({'error': 'Invalid role. Must be "supervisor" or "member"'}), 400
 
-        # Check if user already exists in either table
-        existing_supervisor = Supervisor.query.filter_by(email=email).first()
-        existing_member = Member.query.filter_by(email=email).first()
-
-        if existing_supervisor or existing_member:
-            return jsonify({'error': 'This email is already registered. Please use a different email or try logging in'}), 409
+        # Check if user already exists in either table (before paying for the
+        # password hash; the insert below still guards against a concurrent one)
+        if email_registered(email):
+            return jsonify({'error': EMAIL_TAKEN_ERROR}), 409
 
         # ==================== CREATE USER ====================
 
         try:
+            # Plain INSERT; no ORM object is needed just to write and echo one row
+            user_id = str(uuid7())
+            values = {
+                'id': user_id,
+                'name': name,
+                'email': email,
+                'password_hash': generate_password_hash(password, method=PASSWORD_HASH_METHOD),
+                'phone': phone if phone else None,
+                'is_active': True,
+            }
             if role == 'supervisor':
-                new_user = Supervisor(
-                    id=str(uuid.uuid4()),
-                    name=name,
-                    email=email,
-                    department=department if department else None,
-                    phone=phone if phone else None,
-                    is_active=True
-                )
+                values['department'] = department if department else None
+                inserted = insert_new_user(Supervisor, values)
             else:  # member
-                new_user = Member(
-                    id=str(uuid.uuid4()),
-                    name=name,
-                    email=email,
-                    phone=phone if phone else None,
-                    is_active=True
-                )
+                inserted = insert_new_user(Member, values)
 
-            new_user.set_password(password)
-            db.session.add(new_user)
+            if not inserted:
+                db.session.rollback()
+                return jsonify({'error': EMAIL_TAKEN_ERROR}), 409
             db.session.commit()
 
             return jsonify({
                 'message': 'User registered successfully',
-                'user': new_user.to_dict()
+                'user': user_dict(role, user_id, name, email, values.get('department'), values['phone'], True)
             }), 201
 
+        except IntegrityError:
+            db.session.rollback()
+            return jsonify({'error': EMAIL_TAKEN_ERROR}), 409
         except Exception as e:
             db.session.rollback()
             return jsonify({'error': 'Failed to create user. Please try again.'}), 500
@@ -307,15 +545,125 @@ def register():
     except Exception as e:
         return jsonify({'error': 'An unexpected error occurred'}), 500
 
+def with_etag(response):
+    """
+    Tag a response with a hash of its body and answer 304 Not Modified when
+    the client's If-None-Match already has it, so repeat polls skip the body
+    """
+    response.set_etag(hashlib.blake2b(response.get_data(), digest_size=8).hexdigest())
+    return response.make_conditional(request)
+
+# Liveness probes hit this constantly; the body never changes, so serialize it once
+_HEALTH_BODY = orjson.dumps({'status': 'ok', 'message': 'Backend is running'})
+
 @app.route('/api/health', methods=['GET'])
 def health():
-    return jsonify({'status': 'ok', 'message': 'Backend is running'}), 200
+    return with_etag(app.response_class(_HEALTH_BODY, status=200, mimetype='application/json'))
 
 
 # ==================== ANALYTICS ENDPOINTS ====================
 
 FASTAPI_URL = os.getenv('FASTAPI_URL', 'http://localhost:8000')
 
+# Shared HTTP session so keep-alive connections to FASTAPI_URL are reused
+# instead of opening a new TCP (and TLS) connection per request
+http_session = requests.Session()
+_http_adapter = HTTPAdapter(
+    pool_connections=20,
+    pool_maxsize=50,
+    max_retries=Retry(total=2, backoff_factor=0.1, status_forcelist=[502, 503, 504])
+)
+http_session.mount('http://', _http_adapter)
+http_session.mount('https://', _http_adapter)
+
+def parse_json_response(response):
+    """
+    Parse a FastAPI response body with orjson, straight from the bytes
+    Decode errors are raised as requests.JSONDecodeError, like response.json()
+    """
+    try:
+        return orjson.loads(response.content)
+    except orjson.JSONDecodeError as e:
+        raise requests.JSONDecodeError(e.msg, e.doc, e.pos) from e
+
+
+# Optional Redis cache of transformed analytics, enabled by setting REDIS_URL
+REDIS_URL = os.getenv('REDIS_URL')
+ANALYTICS_CACHE_TTL = int(os.getenv('ANALYTICS_CACHE_TTL', 300))
+analytics_cache = redis.Redis.from_url(REDIS_URL, max_connections=32) if REDIS_URL else None
+
+# Without Redis, fall back to a bounded in-process cache: user_id -> (expires_at, body)
+LOCAL_ANALYTICS_CACHE_SIZE = 1024
+_local_analytics = {}
+_local_analytics_lock = threading.Lock()
+
+
+def get_cached_analytics(user_id: str):
+    """Return the cached analytics response body for a user, or None"""
+    if analytics_cache is None:
+        entry = _local_analytics.get(user_id)
+        if entry is not None and entry[0] > time.monotonic():
+            return entry[1]
+        return None
+    try:
+        return analytics_cache.get(f"analytics:{user_id}")
+    except redis.RedisError:
+        return None
+
+
+def cache_analytics(analytics_by_user: dict):
+    """Store analytics for one or more users, serialized as get_analytics returns them"""
+    if not analytics_by_user:
+        return
+    if analytics_cache is None:
+        expires_at = time.monotonic() + ANALYTICS_CACHE_TTL
+        with _local_analytics_lock:
+            for user_id, analytics in analytics_by_user.items():
+                # Re-insert so the dict stays in write order and the oldest entry is evicted first
+                _local_analytics.pop(user_id, None)
+                _local_analytics[user_id] = (expires_at, app.json.dumps({'analytics': analytics}))
+            while len(_local_analytics) > LOCAL_ANALYTICS_CACHE_SIZE:
+                del _local_analytics[next(iter(_local_analytics))]
+        return
+    try:
+        pipe = analytics_cache.pipeline(transaction=False)
+        for user_id, analytics in analytics_by_user.items():
+            pipe.setex(f"analytics:{user_id}", ANALYTICS_CACHE_TTL, app.json.dumps({'analytics': analytics}))
+        pipe.execute()
+    except redis.RedisError:
+        pass
+
+
+# Batch analytics requests are split into chunks that are fetched concurrently
+BATCH_CHUNK_SIZE = 50
+_batch_executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix='analytics')
+
+
+def fetch_batch_predictions(user_ids: list) -> dict:
+    """
+    Fetch predictions for many users from FastAPI, BATCH_CHUNK_SIZE at a time
+    Returns the merged predictions dict; raises requests.RequestException
+    if any chunk fails
+    """
+    def fetch_chunk(chunk):
+        response = http_session.post(
+            f"{FASTAPI_URL}/features/predict/batch",
+            json={'user_ids': chunk},
+            timeout=60
+        )
+        response.raise_for_status()
+        return parse_json_response(response).get('predictions', {})
+
+    chunks = [user_ids[i:i + BATCH_CHUNK_SIZE] for i in range(0, len(user_ids), BATCH_CHUNK_SIZE)]
+    if len(chunks) == 1:
+        return fetch_chunk(chunks[0])
+
+    predictions = {}
+    for chunk_predictions in _batch_executor.map(fetch_chunk, chunks):
+        predictions.update(chunk_predictions)
+    return predictions
+
+
 @app.route('/api/analytics/update/<user_id>', methods=['POST'])
 def update_analytics(user_id):
     """
@@ -324,15 +672,12 @@ def update_analytics(user_id):
     """
     try:
         # Validate user exists
-        member = Member.query.filter_by(id=user_id).first()
-        supervisor = Supervisor.query.filter_by(id=user_id).first()
-
-        if not member and not supervisor:
+        if not user_exists(user_id):
             return jsonify({'error': 'User not found'}), 404
 
         # Call FastAPI to get predictions
         try:
-            response = requests.post(
+            response = http_session.post(
                 f"{FASTAPI_URL}/features/predict/{user_id}",
                 json={},
                 timeout=30
@@ -344,7 +689,7 @@ def update_analytics(user_id):
                 }), 404
 
             response.raise_for_status()
-            prediction_data = response.json()
+            prediction_data = parse_json_response(response)
         except requests.Timeout:
             return jsonify({'error': 'Request timeout. Please try again.'}), 504
         except requests.ConnectionError:
@@ -354,6 +699,7 @@ def update_analytics(user_id):
 
         # Transform to frontend format
         analytics = transform_to_frontend_format(user_id, prediction_data)
+        cache_analytics({user_id: analytics})
 
         return jsonify({
             'message': 'Analytics updated successfully',
@@ -372,12 +718,14 @@ def get_analytics(user_id):
     If no cache exists, triggers an update
     """
     try:
-        # Try to get from cache first (you could use Redis or database)
-        # For now, we'll fetch fresh data
+        # Serve the stored response body as-is while it is fresh
+        cached = get_cached_analytics(user_id)
+        if cached is not None:
+            return with_etag(app.response_class(cached, status=200, mimetype='application/json'))
 
         # Call FastAPI to get predictions
         try:
-            response = requests.post(
+            response = http_session.post(
                 f"{FASTAPI_URL}/features/predict/{user_id}",
                 json={},
                 timeout=30
@@ -390,7 +738,7 @@ def get_analytics(user_id):
                 }), 404
 
             response.raise_for_status()
-            prediction_data = response.json()
+            prediction_data = parse_json_response(response)
         except requests.RequestException as e:
             return jsonify({
                 'error': f'Failed to fetch analytics: {str(e)}',
@@ -399,8 +747,9 @@ def get_analytics(user_id):
 
         # Transform to frontend format
         analytics = transform_to_frontend_format(user_id, prediction_data)
+        cache_analytics({user_id: analytics})
 
-        return jsonify({'analytics': analytics}), 200
+        return with_etag(jsonify({'analytics': analytics}))
 
     except Exception as e:
         return jsonify({'error': f'An unexpected error occurred: {str(e)}'}), 500
@@ -413,7 +762,7 @@ def batch_update_analytics():
     Request body: { "user_ids": ["id1", "id2", ...] }
     """
     try:
-        data = request.get_json()
+        data = read_json_body()
 
         if not data:
             return jsonify({'error': 'No JSON data provided'}), 400
@@ -425,25 +774,17 @@ def batch_update_analytics():
 
         # Call FastAPI batch prediction endpoint
         try:
-            response = requests.post(
-                f"{FASTAPI_URL}/features/predict/batch",
-                json={'user_ids': user_ids},
-                timeout=60
-            )
-            response.raise_for_status()
-            batch_predictions = response.json()
+            predictions = fetch_batch_predictions(user_ids)
         except requests.RequestException as e:
             return jsonify({'error': f'Failed to fetch batch predictions: {str(e)}'}), 500
 
         # Transform results
-        results = {}
-        predictions = batch_predictions.get('predictions', {})
+        results = transform_batch_to_frontend_format(predictions)
 
-        for user_id, prediction_data in predictions.items():
-            if 'error' in prediction_data:
-                results[user_id] = {'error': prediction_data['error']}
-            else:
-                results[user_id] = transform_to_frontend_format(user_id, prediction_data)
+        cache_analytics({
+            user_id: analytics for user_id, analytics in results.items()
+            if 'error' not in analytics
+        })
 
         return jsonify({
             'message': f'Updated analytics for {len(results)} users',
@@ -456,98 +797,153 @@ def batch_update_analytics():
 
 # ==================== HELPER FUNCTIONS ====================
 
+# Level tables: a score below the first bound gets the first label, and so on
+_STRESS_BOUNDS = (0.4, 0.6)
+_STRESS_LEVELS = ('low', 'medium', 'high')
+
+# Simple trend from the wellbeing score (can be enhanced with historical data)
+_TREND_BOUNDS = (50, 75)
+_TRENDS = ('down', 'stable', 'up')
+
 def calculate_stress_level(burnout_score: float) -> str:
     """Calculate stress level from burnout score"""
-    if burnout_score < 0.4:
-        return 'low'
-    elif burnout_score < 0.6:
-        return 'medium'
-    else:
-        return 'high'
+    return _STRESS_LEVELS[bisect_right(_STRESS_BOUNDS, burnout_score)]
 
 
 def transform_to_frontend_format(user_id: str, prediction_data: dict) -> dict:
     """Transform ML predictions to frontend expected format"""
     predictions = prediction_data.get('predictions', {})
-    features = prediction_data.get('features', {})
-    interpretations = prediction_data.get('interpretations', {})
 
     # Get prediction values
     performance_score = predictions.get('performance_score', 0.5)
     burnout_risk_score = predictions.get('burnout_risk_score', 0.5)
 
-    # Convert to percentages (0-100 scale)
+    # Convert to percentages (0-100 scale); efficiency is the inverse of burnout risk
     wellbeing_score = int(performance_score * 100)
-    burnout_risk = int(burnout_risk_score * 100)
-
-    # Calculate efficiency (inverse of burnout risk, scaled)
-    efficiency = int((1 - burnout_risk_score) * 100)
-
-    # Get features with defaults
-    task_completion_rate = int(features.get('task_completion_rate', 0.7) * 100)
-    logged_hours = features.get('logged_hours_per_week', 40)
-    meeting_hours = features.get('meeting_hours_per_week', 10)
-    meeting_count = features.get('meeting_count_per_week', 5)
-    messages_sent = features.get('messages_sent_per_week', 50)
-    messages_received = features.get('messages_received_per_week', 60)
-
-    # Work pattern metrics
-    early_starts = features.get('early_starts_count', 0)
-    late_exits = features.get('late_exits_count', 0)
-    late_starts = features.get('late_starts_count', 0)
-    early_exits = features.get('early_exits_count', 0)
-
-    # Calculate stress level
-    stress_level = calculate_stress_level(burnout_risk_score)
-
-    # Simple trend calculation (can be enhanced with historical data)
-    trend = 'stable'
-    if wellbeing_score >= 75:
-        trend = 'up'
-    elif wellbeing_score < 50:
-        trend = 'down'
-
-    # Determine if exhausted (high burnout and low performance)
-    is_exhausted = burnout_risk_score > 0.6 and performance_score < 0.5
+
+    return _frontend_record(
+        prediction_data,
+        performance_score,
+        burnout_risk_score,
+        wellbeing_score,
+        int(burnout_risk_score * 100),
+        int((1 - burnout_risk_score) * 100),
+        calculate_stress_level(burnout_risk_score),
+        _TRENDS[bisect_right(_TREND_BOUNDS, wellbeing_score)],
+        datetime.utcnow().isoformat()
+    )
+
+
+def transform_batch_to_frontend_format(batch_predictions: dict) -> dict:
+    """
+    Transform a batch of ML predictions (user_id -> prediction data) to
+    frontend format. Entries with an 'error' are passed through as errors.
+    """
+    scored = [
+        (user_id, prediction_data) for user_id, prediction_data in batch_predictions.items()
+        if 'error' not in prediction_data
+    ]
+
+    # Percentages for the whole batch in one pass; anything that is not a
+    # finite number goes through the per-user transform instead
+    analytics_by_user = {}
+    if scored:
+        score_pairs = []
+        for _, prediction_data in scored:
+            predictions = prediction_data.get('predictions', {})
+            score_pairs.append((
+                predictions.get('performance_score', 0.5),
+                predictions.get('burnout_risk_score', 0.5)
+            ))
+
+        try:
+            scores = np.array(score_pairs, dtype=np.float64)
+        except (TypeError, ValueError):
+            scores = None
+
+        if scores is not None and np.isfinite(scores).all():
+            raw_scores = scores.tolist()
+            percentages = (scores * 100).astype(np.int64).tolist()
+            efficiencies = ((1 - scores[:, 1]) * 100).astype(np.int64).tolist()
+            stress_levels = np.digitize(scores[:, 1], _STRESS_BOUNDS).tolist()
+            trends = np.digitize((scores[:, 0] * 100).astype(np.int64), _TREND_BOUNDS).tolist()
+            last_updated = datetime.utcnow().isoformat()
+
+            for i, (user_id, prediction_data) in enumerate(scored):
+                performance_score, burnout_risk_score = raw_scores[i]
+                wellbeing_score, burnout_risk = percentages[i]
+                analytics_by_user[user_id] = _frontend_record(
+                    prediction_data, performance_score, burnout_risk_score,
+                    wellbeing_score, burnout_risk, efficiencies[i],
+                    _STRESS_LEVELS[stress_levels[i]], _TRENDS[trends[i]], last_updated
+                )
+        else:
+            for user_id, prediction_data in scored:
+                analytics_by_user[user_id] = transform_to_frontend_format(user_id, prediction_data)
+
+    return {
+        user_id: analytics_by_user[user_id] if 'error' not in prediction_data else {'error': prediction_data['error']}
+        for user_id, prediction_data in batch_predictions.items()
+    }
+
+
+def _frontend_record(
+    prediction_data: dict,
+    performance_score: float,
+    burnout_risk_score: float,
+    wellbeing_score: int,
+    burnout_risk: int,
+    efficiency: int,
+    stress_level: str,
+    trend: str,
+    last_updated: str
+) -> dict:
+    """Assemble the frontend analytics dict once the scores are known"""
+    features = prediction_data.get('features', {})
+    interpretations = prediction_data.get('interpretations', {})
+    burnout_interpretation = interpretations.get('burnout_risk_score', {})
 
     return {
         # Core metrics
         'wellbeingScore': wellbeing_score,
         'burnoutRisk': burnout_risk,
         'efficiency': efficiency,
-        'taskCompletionRate': task_completion_rate,
-        'loggedHours': round(logged_hours, 1),
+        'taskCompletionRate': int(features.get('task_completion_rate', 0.7) * 100),
+        'loggedHours': round(features.get('logged_hours_per_week', 40), 1),
 
         # Status indicators
         'stressLevel': stress_level,
         'trend': trend,
-        'isExhausted': is_exhausted,
+        # Exhausted means high burnout and low performance
+        'isExhausted': burnout_risk_score > 0.6 and performance_score < 0.5,
 
         # Meeting metrics
-        'meetingHours': round(meeting_hours, 1),
-        'meetingCount': meeting_count,
+        'meetingHours': round(features.get('meeting_hours_per_week', 10), 1),
+        'meetingCount': features.get('meeting_count_per_week', 5),
 
         # Communication metrics
-        'messagesSent': messages_sent,
-        'messagesReceived': messages_received,
+        'messagesSent': features.get('messages_sent_per_week', 50),
+        'messagesReceived': features.get('messages_received_per_week', 60),
 
         # Work pattern metrics
-        'earlyStarts': early_starts,
-        'lateExits': late_exits,
-        'lateStarts': late_starts,
-        'earlyExits': early_exits,
+        'earlyStarts': features.get('early_starts_count', 0),
+        'lateExits': features.get('late_exits_count', 0),
+        'lateStarts': features.get('late_starts_count', 0),
+        'earlyExits': features.get('early_exits_count', 0),
 
         # Additional context
         'lastActive': 'Just now',
-        'lastUpdated': datetime.utcnow().isoformat(),
+        'lastUpdated': last_updated,
 
         # Include interpretations for context
         'performanceInterpretation': interpretations.get('performance_score', {}).get('category', 'average'),
-        'burnoutInterpretation': interpretations.get('burnout_risk_score', {}).get('category', 'moderate'),
-        'recommendations': interpretations.get('burnout_risk_score', {}).get('recommendation', '')
+        'burnoutInterpretation': burnout_interpretation.get('category', 'moderate'),
+        'recommendations': burnout_interpretation.get('recommendation', '')
     }
 
 
 if __name__ == '__main__':
+    # Development server; production runs under gunicorn via start_server.py.
+    # The debugger and reloader only come on with FLASK_ENV=development (.env.example)
     port = int(os.getenv('FLASK_PORT', 5000))
-    app.run(debug=True, port=port, host='0.0.0.0')
+    app.run(debug=os.getenv('FLASK_ENV') == 'development', port=port, host='0.0.0.0')
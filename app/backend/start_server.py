@@ -0,0 +1,32 @@
+#!/usr/bin/env python
+"""
+Startup script for the Flask backend in production
+"""
+import os
+
+def main():
+    """Start the Flask application under gunicorn"""
+    port = int(os.getenv('FLASK_PORT', 5000))
+    workers = int(os.getenv('WEB_CONCURRENCY', os.cpu_count() or 1))
+    threads = int(os.getenv('GUNICORN_THREADS', 8))
+
+    # Threaded workers on every core, so password hashing on login/register
+    # runs in parallel and analytics calls wait on I/O without blocking a
+    # worker. exec hands the process to gunicorn; --preload imports the app
+    # once in the master before forking.
+    args = [
+        "gunicorn", "app:app",
+        "--worker-class", "gthread",
+        "--bind", f"0.0.0.0:{port}",
+        "--workers", str(workers),
+        "--threads", str(threads),
+        "--timeout", "120",
+        "--log-level", "info",
+        "--access-logfile", "-",
+        "--error-logfile", "-",
+        "--preload"
+    ]
+    os.execvp(args[0], args)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,23 @@
+"""
+Test configuration: make app.py importable as the backend's `app` module
+and point it at a throwaway SQLite database before it is imported
+"""
+import os
+import shutil
+import sys
+import tempfile
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).parent.parent
+
+if str(BACKEND_DIR) not in sys.path:
+    sys.path.insert(0, str(BACKEND_DIR))
+
+# app.py creates tables and indexes on import, so this has to be set before
+# any test module imports it; load_dotenv() does not override it
+_DB_DIR = tempfile.mkdtemp(prefix='workforce-tests-')
+os.environ['DATABASE_URL'] = f"sqlite:///{Path(_DB_DIR) / 'workforce.db'}"
+
+
+def pytest_unconfigure(config):
+    shutil.rmtree(_DB_DIR, ignore_errors=True)
@@ -0,0 +1,47 @@
+"""
+Tests for user registration inserts
+"""
+import uuid
+
+import pytest
+from sqlalchemy import delete, func, select
+
+import app as backend
+from app import Member, app, db, insert_new_user
+
+
+def _member_values(email):
+    return {
+        'id': str(backend.uuid7()),
+        'name': 'Test Member',
+        'email': email,
+        'password_hash': 'not-a-real-hash',
+        'phone': None,
+        'is_active': True,
+    }
+
+
+@pytest.fixture
+def email():
+    address = f'register-{uuid.uuid4().hex}@example.com'
+    yield address
+    with app.app_context():
+        db.session.execute(delete(Member).where(func.lower(Member.email) == address))
+        db.session.commit()
+
+
+@pytest.mark.parametrize('index_ready', [True, False], ids=['with-email-index', 'without-email-index'])
+def test_same_email_in_different_case_is_inserted_once(email, index_ready, monkeypatch):
+    monkeypatch.setitem(backend._email_index_ready, Member.__tablename__, index_ready)
+
+    with app.app_context():
+        first = insert_new_user(Member, _member_values(email))
+        second = insert_new_user(Member, _member_values(email.upper()))
+        db.session.commit()
+        rows = db.session.scalar(
+            select(func.count()).select_from(Member).where(func.lower(Member.email) == email)
+        )
+
+    assert first is True
+    assert second is False
+    assert rows == 1
@@ -10,14 +10,67 @@ It supports three prediction types:
 
 import os
 import json
-import pickle
+import math
+import time
+import joblib
 import numpy as np
 import pandas as pd
-from typing import Dict, List, Union, Tuple
+from typing import Dict, List, Optional, Union, Tuple
+from functools import lru_cache
 from pathlib import Path
 from sklearn.impute import SimpleImputer
 
 
+# Category lookups are cached on integer score buckets. The thresholds below
+# are whole buckets, so flooring the score never moves it across a boundary.
+
+def _hundredths_bucket(score: float) -> int:
+    """Floor a 0-1 score to hundredths, guarding against x * 100 rounding up."""
+    bucket = math.floor(score * 100)
+    if bucket / 100 > score:
+        bucket -= 1
+    return bucket
+
+
+@lru_cache(maxsize=1024)
+def _risk_category_for_bucket(bucket: int) -> Tuple[str, str]:
+    """Burnout risk category for a score floored to hundredths (0-100)."""
+    if bucket < 30:
+        return ("Low", "Employee shows minimal signs of burnout")
+    elif bucket < 60:
+        return ("Moderate", "Employee may be experiencing some stress")
+    elif bucket < 80:
+        return ("High", "Employee shows concerning signs of burnout")
+    else:
+        return ("Critical", "Immediate intervention recommended")
+
+
+@lru_cache(maxsize=1024)
+def _wellbeing_category_for_bucket(bucket: int) -> Tuple[str, str]:
+    """Wellbeing category for a score floored to whole points (0-100)."""
+    if bucket >= 80:
+        return ("Excellent", "Employee has strong mental and physical wellbeing")
+    elif bucket >= 60:
+        return ("Good", "Employee's wellbeing is satisfactory")
+    elif bucket >= 40:
+        return ("Fair", "Employee's wellbeing needs attention")
+    else:
+        return ("Poor", "Employee's wellbeing requires immediate support")
+
+
+@lru_cache(maxsize=1024)
+def _efficiency_category_for_bucket(bucket: int) -> Tuple[str, str]:
+    """Efficiency category for a score floored to whole points (0-100)."""
+    if bucket >= 80:
+        return ("Excellent", "Highly productive and efficient")
+    elif bucket >= 60:
+        return ("Good", "Performing well with room for improvement")
+    elif bucket >= 40:
+        return ("Moderate", "Performance is below expected levels")
+    else:
+        return ("Low", "Significant performance concerns")
+
+
 class WorkforceAnalyticsPredictor:
     """
     A predictor class for workforce analytics that loads trained models
@@ -134,13 +187,32 @@ class WorkforceAnalyticsPredictor:
         
         # Store defaults for later use
         self.feature_defaults = defaults
+        
+        # Defaults in feature-column order, used to fill missing values in one
+        # vectorized pass (equivalent to the median imputer fitted above)
+        self.default_vector = np.array(
+            [defaults[feature] for feature in self.feature_columns], dtype=float
+        )
+        
+        # Role column positions and the Developer one-hot used when no role is given
+        self.role_indices = np.array(
+            [i for i, feature in enumerate(self.feature_columns) if feature.startswith('role_')],
+            dtype=np.intp
+        )
+        self.default_roles = np.array(
+            [1.0 if self.feature_columns[i] == 'role_Developer' else 0.0 for i in self.role_indices]
+        )
     
     def _load_pickle(self, filename: str):
-        """Load a pickle file from the models directory."""
+        """
+        Load a pickle file from the models directory.
+        
+        Files are read with joblib using mmap_mode='r', so numpy arrays inside
+        the models are memory-mapped and shared between forked worker processes.
+        """
         filepath = self.models_dir / filename
         try:
-            with open(filepath, 'rb') as f:
-                return pickle.load(f)
+            return joblib.load(filepath, mmap_mode='r')
         except Exception as e:
             print(f"Error loading {filename}: {e}")
             print(f"File path: {filepath}")
@@ -199,21 +271,52 @@ class WorkforceAnalyticsPredictor:
                 if pd.isna(complete_df[role_col].iloc[0]):
                     complete_df[role_col] = 0
         
-        # Use imputer to fill remaining missing values
-        # First, get columns that are not roles (already handled)
-        non_role_columns = [col for col in self.feature_columns if not col.startswith('role_')]
-        
-        # Apply imputation to non-role columns
-        if complete_df[non_role_columns].isna().any().any():
-            # Replace NaN with median values from imputer
-            imputed_values = self.imputer.transform(complete_df[self.feature_columns])
-            complete_df = pd.DataFrame(imputed_values, columns=self.feature_columns)
+        # Fill remaining missing values with the per-feature defaults
+        # (role columns were handled above, so only non-role NaNs remain)
+        values = complete_df[self.feature_columns].to_numpy(dtype=float)
+        missing = np.isnan(values)
+        if missing.any():
+            values = np.where(missing, self.default_vector, values)
+            complete_df = pd.DataFrame(values, columns=self.feature_columns)
         
         # Ensure correct order
         complete_df = complete_df[self.feature_columns]
         
         return complete_df
     
+    def feature_vector(self, employee_data: Dict) -> np.ndarray:
+        """
+        Build one employee's feature row without going through a DataFrame.
+        
+        Gives the same values as prepare_features for dicts of numbers (or
+        None); anything else, such as numeric strings, falls back to it.
+        
+        Args:
+            employee_data: Dictionary with employee features
+        
+        Returns:
+            1D float array in feature_columns order, missing values imputed
+        """
+        raw = [employee_data.get(feature) for feature in self.feature_columns]
+        try:
+            if any(isinstance(value, str) for value in raw):
+                raise TypeError
+            values = np.array(raw, dtype=float)
+        except (TypeError, ValueError):
+            return self.prepare_features(employee_data).to_numpy(dtype=float)[0]
+        
+        roles = values[self.role_indices]
+        if (roles == 1).any():
+            values[self.role_indices] = np.where(np.isnan(roles), 0.0, roles)
+        else:
+            values[self.role_indices] = self.default_roles
+        
+        missing = np.isnan(values)
+        if missing.any():
+            values[missing] = self.default_vector[missing]
+        
+        return values
+    
     def get_missing_features(self, employee_data: Union[Dict, pd.DataFrame]) -> List[str]:
         """
         Get list of features that were missing from the input data.
@@ -224,11 +327,14 @@ class WorkforceAnalyticsPredictor:
         Returns:
             List of feature names that were missing (and will be imputed)
         """
-        # Convert to DataFrame if dict
+        # Dicts are checked directly rather than through a one-row DataFrame
         if isinstance(employee_data, dict):
-            df = pd.DataFrame([employee_data])
-        else:
-            df = employee_data.copy()
+            return [
+                col for col in self.feature_columns
+                if col not in employee_data or pd.isna(employee_data[col])
+            ]
+        
+        df = employee_data.copy()
         
         missing_features = []
         for col in self.feature_columns:
@@ -257,6 +363,19 @@ class WorkforceAnalyticsPredictor:
             'data_completeness': f"{((len(self.feature_columns) - len(missing)) / len(self.feature_columns) * 100):.1f}%"
         }
     
+    def _predict_model(self, model_type: str, features: pd.DataFrame) -> np.ndarray:
+        """
+        Scale features and run one model on them.
+        
+        The scaled matrix is handed over as contiguous float32, which is the
+        dtype sklearn's tree ensembles compare against internally, so the
+        model can use it without making its own converted copy.
+        """
+        features_scaled = self.scalers[model_type].transform(features)
+        return self.models[model_type].predict(
+            np.ascontiguousarray(features_scaled, dtype=np.float32)
+        )
+    
     def predict_burnout_risk(self, employee_data: Union[Dict, pd.DataFrame]) -> Union[float, np.ndarray]:
         """
         Predict burnout risk for employee(s).
@@ -268,8 +387,7 @@ class WorkforceAnalyticsPredictor:
             Burnout risk score(s) between 0 and 1 (higher = more risk)
         """
         features = self.prepare_features(employee_data)
-        features_scaled = self.scalers['burnout_risk'].transform(features)
-        predictions = self.models['burnout_risk'].predict(features_scaled)
+        predictions = self._predict_model('burnout_risk', features)
         
         # Clip predictions to valid range [0, 1]
         predictions = np.clip(predictions, 0, 1)
@@ -287,8 +405,7 @@ class WorkforceAnalyticsPredictor:
             Wellbeing score(s) between 0 and 100 (higher = better wellbeing)
         """
         features = self.prepare_features(employee_data)
-        features_scaled = self.scalers['wellbeing'].transform(features)
-        predictions = self.models['wellbeing'].predict(features_scaled)
+        predictions = self._predict_model('wellbeing', features)
         
         # Clip predictions to valid range [0, 100]
         predictions = np.clip(predictions, 0, 100)
@@ -306,8 +423,7 @@ class WorkforceAnalyticsPredictor:
             Efficiency score(s) between 0 and 100 (higher = more efficient)
         """
         features = self.prepare_features(employee_data)
-        features_scaled = self.scalers['efficiency'].transform(features)
-        predictions = self.models['efficiency'].predict(features_scaled)
+        predictions = self._predict_model('efficiency', features)
         
         # Clip predictions to valid range [0, 100]
         predictions = np.clip(predictions, 0, 100)
@@ -330,6 +446,67 @@ class WorkforceAnalyticsPredictor:
             'efficiency': self.predict_efficiency(employee_data)
         }
     
+    def predict_all_batch(
+        self,
+        employee_records: List[Dict],
+        timings: Optional[Dict[str, float]] = None
+    ) -> List[Dict[str, float]]:
+        """
+        Predict all three metrics for many employees with one model call each.
+        
+        Args:
+            employee_records: List of employee feature dictionaries
+            timings: Optional dict that receives each model's pass time in ms
+        
+        Returns:
+            List of dictionaries with burnout_risk, wellbeing, and efficiency,
+            in the same order as the input records
+        """
+        if not employee_records:
+            return []
+        
+        # Each record is prepared on its own so role defaults and imputation
+        # behave exactly as they do for single predictions
+        X = np.vstack([self.feature_vector(record) for record in employee_records])
+        predictions = self.predict_matrix(X, timings)
+        
+        return [
+            {'burnout_risk': b, 'wellbeing': w, 'efficiency': e}
+            for b, w, e in zip(
+                predictions['burnout_risk'],
+                predictions['wellbeing'],
+                predictions['efficiency']
+            )
+        ]
+    
+    def predict_matrix(
+        self,
+        X: np.ndarray,
+        timings: Optional[Dict[str, float]] = None
+    ) -> Dict[str, np.ndarray]:
+        """
+        Predict all three metrics for a complete feature matrix.
+        
+        Args:
+            X: 2D array with one row per employee, columns in feature_columns
+               order and missing values already filled
+            timings: Optional dict that receives each model's pass time in ms
+        
+        Returns:
+            Dictionary with burnout_risk, wellbeing, and efficiency arrays
+        """
+        # Scalers were fitted on named columns; wrap without copying
+        features = pd.DataFrame(X, columns=self.feature_columns, copy=False)
+        
+        predictions = {}
+        for model_type, upper in (('burnout_risk', 1), ('wellbeing', 100), ('efficiency', 100)):
+            start = time.perf_counter_ns()
+            predictions[model_type] = np.clip(self._predict_model(model_type, features), 0, upper)
+            if timings is not None:
+                timings[model_type] = (time.perf_counter_ns() - start) / 1e6
+        
+        return predictions
+    
     def get_risk_category(self, burnout_risk: float) -> Tuple[str, str]:
         """
         Categorize burnout risk level.
@@ -340,14 +517,7 @@ class WorkforceAnalyticsPredictor:
         Returns:
             Tuple of (category, description)
         """
-        if burnout_risk < 0.3:
-            return ("Low", "Employee shows minimal signs of burnout")
-        elif burnout_risk < 0.6:
-            return ("Moderate", "Employee may be experiencing some stress")
-        elif burnout_risk < 0.8:
-            return ("High", "Employee shows concerning signs of burnout")
-        else:
-            return ("Critical", "Immediate intervention recommended")
+        return _risk_category_for_bucket(_hundredths_bucket(burnout_risk))
     
     def get_wellbeing_category(self, wellbeing: float) -> Tuple[str, str]:
         """
@@ -359,14 +529,7 @@ class WorkforceAnalyticsPredictor:
         Returns:
             Tuple of (category, description)
         """
-        if wellbeing >= 80:
-            return ("Excellent", "Employee has strong mental and physical wellbeing")
-        elif wellbeing >= 60:
-            return ("Good", "Employee's wellbeing is satisfactory")
-        elif wellbeing >= 40:
-            return ("Fair", "Employee's wellbeing needs attention")
-        else:
-            return ("Poor", "Employee's wellbeing requires immediate support")
+        return _wellbeing_category_for_bucket(math.floor(wellbeing))
     
     def get_efficiency_category(self, efficiency: float) -> Tuple[str, str]:
         """
@@ -378,14 +541,7 @@ class WorkforceAnalyticsPredictor:
         Returns:
             Tuple of (category, description)
         """
-        if efficiency >= 80:
-            return ("Excellent", "Highly productive and efficient")
-        elif efficiency >= 60:
-            return ("Good", "Performing well with room for improvement")
-        elif efficiency >= 40:
-            return ("Moderate", "Performance is below expected levels")
-        else:
-            return ("Low", "Significant performance concerns")
+        return _efficiency_category_for_bucket(math.floor(efficiency))
     
     def get_feature_importance(self, model_type: str, top_n: int = 10) -> pd.DataFrame:
         """
@@ -487,6 +643,34 @@ RECOMMENDATIONS
         return report
 
 
+# Shared predictor instances, keyed by resolved models directory
+_PREDICTORS: Dict[str, WorkforceAnalyticsPredictor] = {}
+
+
+def get_predictor(models_dir: str = None) -> WorkforceAnalyticsPredictor:
+    """
+    Get or create the shared predictor for a models directory.
+    
+    Every module that needs the models should go through this function so
+    the model files are loaded once per process instead of once per importer.
+    
+    Args:
+        models_dir: Path to the directory containing model files.
+                   If None, uses the parent directory of this script.
+    
+    Returns:
+        The shared WorkforceAnalyticsPredictor for that directory
+    """
+    if models_dir is None:
+        models_dir = Path(__file__).parent.parent
+    
+    key = str(Path(models_dir).resolve())
+    if key not in _PREDICTORS:
+        _PREDICTORS[key] = WorkforceAnalyticsPredictor(models_dir=key)
+    
+    return _PREDICTORS[key]
+
+
 def main():
     """
     Example usage of the WorkforceAnalyticsPredictor.